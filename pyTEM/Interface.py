@@ -90,12 +90,12 @@ class Interface(AcquisitionMixin,    # Microscope acquisition controls, includin
                                              alpha=math.degrees(scope_position.A),  # rad -> deg
                                              beta=math.degrees(scope_position.B))  # rad -> deg
 
-        self._image_shift_matrix = np.asarray([[1.010973981, 0.54071542],
-                                               [-0.54071542, 1.010973981]])
+        self._set_image_shift_matrix(a=np.asarray([[1.010973981, 0.54071542],
+                                                   [-0.54071542, 1.010973981]]))
 
         # TODO: Perform some experiment to validate this beam shift matrix
-        self._beam_shift_matrix = np.asarray([[1.010973981, 0.54071542],
-                                              [0.54071542, -1.010973981]])
+        self._set_beam_shift_matrix(a=np.asarray([[1.010973981, 0.54071542],
+                                                  [0.54071542, -1.010973981]]))
 
     def normalize(self) -> None:
         """
@@ -26,6 +26,14 @@ from pyTEM.lib.make_dict_jsonable import make_dict_jsonable
 from pyTEM.lib.rgb_to_greyscale import rgb_to_greyscale
 from pyTEM.lib.stock_mrc_extended_header.get_stock_mrc_header import get_stock_mrc_extended_header
 
+try:
+    # Have comtypes unpack SAFEARRAYs straight into numpy arrays (see _read_tm_acquisition()).
+    from comtypes import npsupport
+    from comtypes.safearray import safearray_as_ndarray
+    npsupport.enable()
+except (ImportError, AttributeError, OSError):
+    safearray_as_ndarray = None  # No comtypes (e.g. not on Windows), but we can still work with images from file.
+
 
 def _build_metadata_dict_from_tm(tm_acquisition_object) \
         -> Dict[str, Union[str, int, float, datetime.time, datetime.date]]:
@@ -78,6 +86,77 @@ def _build_metadata_dict_from_tm(tm_acquisition_object) \
             'AlignIntegratedImage':     tm_acquisition_object.Metadata[33].ValueAsString}
 
 
+def _read_tm_acquisition(tm_acquisition_object) -> Tuple[Any, Dict[str, Union[str, int, float, datetime.time,
+                                                                              datetime.date]]]:
+    """
+    Read everything we need out of a Thermo Fisher Acquisition object.
+
+    This is the only part of building an Acquisition from a Thermo Fisher Acquisition object that goes through the COM
+     interface, and so it needs to be done from the thread in which the Thermo Fisher Acquisition object was created.
+     The rest (see _tm_image_to_array()) can be done from any thread.
+
+    By default, comtypes unpacks a SAFEARRAY into nested tuples of Python ints (that's 16 million Python objects for a
+     4k image), which numpy then has to convert back into an array. Instead, we have comtypes copy the SAFEARRAY
+     straight into a numpy array.
+
+    :param tm_acquisition_object: A Thermo Fisher Acquisition object.
+
+    :return:
+        The raw image data (as unpacked from the SAFEARRAY by comtypes, a numpy array where supported).
+        dictionary: The metadata, see _build_metadata_dict_from_tm().
+    """
+    if safearray_as_ndarray is None:
+        image_data = tm_acquisition_object.AsSafeArray
+    else:
+        with safearray_as_ndarray:
+            image_data = tm_acquisition_object.AsSafeArray
+
+    return image_data, _build_metadata_dict_from_tm(tm_acquisition_object=tm_acquisition_object)
+
+
+def _tm_image_to_array(image_data, out: np.ndarray = None) -> np.ndarray:
+    """
+    Convert the raw image data read from a Thermo Fisher Acquisition object (see _read_tm_acquisition()) into an image.
+
+    Notice that we load as a 16-bit image.
+    Notice that we will to flip and then rotate the image to match what is shown on the FluCam.
+    np.flip() and np.rot90() both return views, so the only copy made here is the one out of the SAFEARRAY. There is no
+     need to copy the image again anywhere downstream.
+
+    :param image_data: The raw image data.
+    :param out: numpy.ndarray (optional; default is None):
+        A preallocated 2D array into which to write the image (e.g. one frame of a preallocated image stack). If None,
+         the returned image is a (flipped and rotated) view of the array unpacked from the SAFEARRAY.
+
+    :return: numpy.ndarray: The image, as a 2D numpy array.
+    """
+    image = np.rot90(np.flip(np.asarray(image_data, dtype=np.int16), axis=1))
+    if out is None:
+        return image
+
+    np.copyto(out, image)
+    return out
+
+
+def _tm_image_shape(image_data) -> Tuple[Tuple[int, int], np.dtype]:
+    """
+    Get the shape and datatype of the image that _tm_image_to_array() would make out of the raw image data, without
+     converting it.
+
+    :param image_data: The raw image data, as read from a Thermo Fisher Acquisition object (see _read_tm_acquisition()).
+
+    :return:
+        tuple of int: The image shape.
+        numpy.dtype: The image datatype.
+    """
+    if isinstance(image_data, np.ndarray):
+        rows, cols = image_data.shape
+    else:
+        rows, cols = len(image_data), len(image_data[0])  # Nested tuples.
+
+    return (cols, rows), np.dtype(np.int16)  # np.rot90() swaps the axes.
+
+
 class Acquisition:
     """
     A simplified, forward facing Acquisition class. This class holds, and allows the user to interact
@@ -189,10 +268,8 @@ class Acquisition:
 
             else:
                 # Try to load from a Thermo Fisher Acquisition object.
-                # Notice that we load as a 16-bit image.
-                # Notice that we will to flip and then rotate the image to match what is shown on the FluCam.
-                self.__image = np.rot90(np.flip(np.asarray(source.AsSafeArray, dtype=np.int16), axis=1))
-                self.__metadata = _build_metadata_dict_from_tm(tm_acquisition_object=source)
+                image_data, self.__metadata = _read_tm_acquisition(tm_acquisition_object=source)
+                self.__image = _tm_image_to_array(image_data=image_data)
 
         except BaseException as e:
             warnings.warn("The Acquisition() constructor received an invalid source.")
@@ -435,7 +512,7 @@ if __name__ == "__main__":
     Testing
     """
 
-    out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve() / "test" / "test_images"
+    out_dir = pathlib.Path(__file__).resolve().parents[1] / "test" / "test_images"
     # in_file_ = out_dir / "Tiltseies_SAD40_-20-20deg_0.5degps_1.1m.tif"
     # in_file_ = out_dir / "2_14.tif"
 
@@ -14,7 +14,7 @@ import mrcfile
 import numpy as np
 import hyperspy.api as hs
 
-from typing import Union, Tuple
+from typing import List, Union, Tuple
 from tifffile import tifffile
 from tifffile.tifffile import RESUNIT
 
@@ -142,8 +142,8 @@ class AcquisitionSeries:
                         elif hs_data.data.ndim == 4:
                             # Then we have an image stack, loop through and covert to grayscale.
                             num_images, x_dim, y_dim, channels = np.shape(hs_data.data)
-                            image_stack_arr = np.full(shape=(num_images, x_dim, y_dim), fill_value=np.nan,
-                                                      dtype=np.uint8)
+                            # Every image is filled in below, so there is no need to initialize the stack.
+                            image_stack_arr = np.empty(shape=(num_images, x_dim, y_dim), dtype=np.uint8)
                             for i in range(num_images):
                                 image_stack_arr[i] = rgb_to_greyscale(rgb_image=hs_data.data[i])
 
@@ -225,6 +225,17 @@ class AcquisitionSeries:
             raise Exception("Error: Unable to append to AcquisitionSeries, either the provided argument is not of type "
                             "Acquisition, the image is the wrong shape, or the image uses the wrong datatype.")
 
+    def _extend_unchecked(self, acqs: List[Acquisition]) -> None:
+        """
+        Add several acquisitions to the end of the series at once, without the per-acquisition checks in append().
+        Only for use where the acquisitions are already known to match the series, e.g. when their images are all
+         views of the same image stack.
+        :param acqs: list of Acquisition:
+            The acquisitions to append.
+        :return: None.
+        """
+        self.__acquisitions.extend(acqs)
+
     def is_empty(self):
         """
         :return: True if the acquisition series is empty (contains 0 acquisitions), False otherwise.
@@ -312,13 +323,13 @@ class AcquisitionSeries:
         """
         if self.length() > 1:
 
-            # Preallocate
+            # Preallocate. Every image is filled in below, so there is no need to initialize the stack (filling an
+            #  integer stack with NaN would only cost us an extra pass over the whole stack, and a cast warning).
             number_images = self.length()
             image_shape = np.shape(self[0].get_image())
             if dtype is None:
                 dtype = self.image_dtype()
-            image_stack_arr = np.full(shape=(number_images, image_shape[0], image_shape[1]), fill_value=np.nan,
-                                      dtype=dtype)
+            image_stack_arr = np.empty(shape=(number_images, image_shape[0], image_shape[1]), dtype=dtype)
 
             # Loop through and actually fill in the stack.
             for i, acq in enumerate(self):
@@ -483,7 +494,7 @@ if __name__ == "__main__":
     """
     Testing.
     """
-    out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve() / "test" / "test_images"
+    out_dir = pathlib.Path(__file__).resolve().parents[1] / "test" / "test_images"
     in_file_ = out_dir / "RGB" / "S1 0_0.tif"
     # in_file_ = out_dir / "RGB" / "rgb_image_stack.tif"
     # in_file_ = out_dir / "2_11.tif"
@@ -517,8 +528,7 @@ if __name__ == "__main__":
     #
     # print(acq_series.get_acquisition(idx=0).get_metadata())
 
-    # in_dir = pathlib.Path(__file__).parent.resolve().parent.resolve().parent.resolve() \
-    #     / "test" / "interface" / "test_images"
+    # in_dir = pathlib.Path(__file__).resolve().parents[2] / "test" / "interface" / "test_images"
     # acq_series.append(Acquisition(str(in_dir) + "/p2v1 1_25x 14.tif"))
     # acq_series.append(Acquisition(str(in_dir) + "/p2v1 1_25x 13.tif"))
     # acq_series.append(Acquisition(str(in_dir) + "/p2v1 1_25x 12.tif"))
@@ -532,13 +542,11 @@ if __name__ == "__main__":
     # print(new_series)
 
     # print("Saving as MRC:")
-    # out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve().parent.resolve().parent.resolve() / "test" \
-    #           / "interface" / "test_images"
+    # out_dir = pathlib.Path(__file__).resolve().parents[3] / "test" / "interface" / "test_images"
     # out_file_ = out_dir / "mrc_test_stack.mrc"
     # acq_series.save_as_mrc(out_file=out_file_)
 
     # print("Saving as TIF:")
-    # out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve().parent.resolve().parent.resolve() / "test" \
-    #           / "interface" / "test_images"
+    # out_dir = pathlib.Path(__file__).resolve().parents[3] / "test" / "interface" / "test_images"
     # out_file_ = out_dir / "tif_test_stack.tif"
     # acq_series.save_as_tif(out_file=out_file_)
@@ -4,9 +4,15 @@
 """
 
 import time
+import comtypes
 
+from typing import Any, Dict
 from numpy.typing import ArrayLike
 
+from pyTEM.lib.com_marshalling import unmarshal_com_object
+from pyTEM.lib.perf_counter_to_epoch import perf_counter_to_epoch
+from pyTEM.lib.raise_thread_priority import raise_thread_priority
+from pyTEM.lib.wait_until import wait_until
 from pyTEM.lib.mixins.BeamBlankerMixin import BeamBlankerInterface
 
 
@@ -54,27 +60,134 @@ def blanker_control(num_acquisitions: int, barriers: ArrayLike, exposure_time: f
 
         barriers[i].wait()  # Synchronize with the main thread/process.
 
-        # Wait while the camera is blind. Notice we wait a little longer than the integration time, this is because
-        #  the acquisition command takes a little longer to issue than the unblank command. We should wait about an
-        #  extra 0.45 seconds, but we unblank 0.025 seconds early to ensure the beam is unblanked in time.
-        time.sleep(0.425 + exposure_time)
+        _unblank_while_recording(interface=interface, exposure_time=exposure_time, verbose=verbose, i=i)
 
-        # Unblank while the acquisition is active.
-        beam_unblank_time = time.time()
-        interface.unblank_beam()  # Command takes 0.15 s
 
-        # Wait while the camera is recording.
-        # Notice we wait a little extra just to be sure the beam is unblanked for whole time the camera is recording.
-        time.sleep(0.025 + exposure_time)
+def blanker_worker(jobs, done, ready, settings: Dict[str, Any], marshalled_tem=None) -> None:
+    """
+    Support pyTEM.Interface.acquisition() with simultaneous blanker control from a persistent parallel thread.
+
+    Unlike blanker_control(), which is spawned anew for every acquisition series, this function is meant to be
+     started once (in a parallel thread) and then reused for all subsequent acquisitions. This saves us the cost of
+     creating a new microscope interface for every acquisition. Even better, if we are given the main thread's
+     Thermo Fisher Instrument object (marshalled into this thread) then we don't need to create our own at all.
+
+    :param jobs: queue.Queue:
+        The queue from which we receive jobs. Each job is the time.perf_counter() value at which the main thread is
+         about to issue the acquisition command, and should be put on the queue right before the acquisition command
+         is issued. Put None on the queue to stop the worker.
+    :param done: threading.Event:
+        Set once we have finished with a job (the beam has been re-blanked).
+    :param ready: threading.Event:
+        Set once we have built our interface and are ready to receive jobs.
+    :param settings: dict:
+        A dictionary shared with the main thread, with the keys 'exposure_time' (the exposure time, in seconds) and
+         'verbose' (whether to print out extra information), and optionally 'latency' (the calibrated blanker
+         latency, see _unblank_while_recording()). These are read at the start of every job, so they only need to be
+         updated when they change (i.e. once per acquisition series) and only while no job is in progress.
+    :param marshalled_tem: (optional; default is None):
+        A Thermo Fisher Instrument object, as marshalled with pyTEM.lib.com_marshalling.marshal_com_object(). If None,
+         we create our own Instrument object.
 
-        # Re-blank the beam.
-        beam_reblank_time = time.time()
-        interface.blank_beam()  # Command takes 0.15 s
+    :return: None.
+    """
+    # COM needs to be initialized in every thread that uses it (comtypes only does so automatically for the main one).
+    comtypes.CoInitialize()
+    try:
+        # Our commands need to go out on time, so we don't want to be preempted.
+        raise_thread_priority()
+
+        # Build an interface to access blanker controls.
+        if marshalled_tem is not None:
+            interface = BeamBlankerInterface(tem=unmarshal_com_object(marshalled_tem))
+        else:
+            interface = BeamBlankerInterface()
+        ready.set()
+
+        i = 0
+        while True:
+            job = jobs.get()
+            if job is None:
+                break  # We are done.
+
+            _unblank_while_recording(interface=interface, exposure_time=settings['exposure_time'],
+                                     verbose=settings['verbose'], i=i, start_time=job,
+                                     latency=settings.get('latency', None), done=done)
+            i += 1
+
+        del interface  # Release the COM object before we uninitialize.
+    finally:
+        comtypes.CoUninitialize()
+
+
+def _unblank_while_recording(interface: BeamBlankerInterface, exposure_time: float, verbose: bool, i: int,
+                             start_time: float = None, latency: float = None, done=None) -> None:
+    """
+    Unblank the beam only while the camera is recording. To be called right when the main thread/process issues the
+     acquisition command.
 
-        if verbose:
-            print("-- Timing results from blanker_control() for acquisition #" + str(i) + " --")
+    :param interface: BeamBlankerInterface:
+        An interface with which to control the blanker.
+    :param exposure_time: float:
+        Exposure time, in seconds.
+    :param verbose: bool:
+        Print out extra information. Useful for debugging and timing analysis.
+    :param i: int:
+        The acquisition number, for printing purposes.
+    :param start_time: float (optional; default is None):
+        The time.perf_counter() value at which the acquisition command was issued. time.perf_counter() is system-wide,
+         so this can come from another thread or process. Passing it along means the time it takes to hand us the job
+         doesn't delay the unblank. If None, we assume the acquisition command was issued right now.
+    :param latency: float (optional; default is None):
+        The calibrated time it takes for a blank/unblank command to return, in seconds (see
+         pyTEM.Interface.calibrate_blanker_latency()). If provided, we issue each command this much earlier, so that
+         the beam is unblanked from 0.025 seconds before the camera starts recording until 0.025 seconds after it
+         stops. If None, we use our uncalibrated (empirical) timing.
+    :param done: threading.Event (optional; default is None):
+        If provided, set as soon as the beam has been re-blanked (before we print anything).
 
-            print("\nIssued the command to unblanked the beam at: " + str(beam_unblank_time))
-            print("Issued the command to re-blanked the beam at: " + str(beam_reblank_time))
-            # Extra 0.15 for unblank command + 0.05 extra unblanked time
-            print("Total time spent with the beam unblanked: " + str(beam_reblank_time - beam_unblank_time - 0.20))
+    :return: None.
+    """
+    # We schedule against absolute time.perf_counter() deadlines rather than chaining sleeps, so that sleep overshoot
+    #  and scheduling jitter don't accumulate over the course of the acquisition.
+    job_start_time = time.perf_counter() if start_time is None else start_time
+
+    if latency is None:
+        latency, unblanked_time = 0.0, 0.025 + exposure_time  # Uncalibrated timing.
+    else:
+        unblanked_time = 0.05 + exposure_time
+
+    # Wait while the camera is blind. Notice we wait a little longer than the integration time, this is because
+    #  the acquisition command takes a little longer to issue than the unblank command. We should wait about an
+    #  extra 0.45 seconds, but we unblank 0.025 seconds early to ensure the beam is unblanked in time.
+    wait_until(deadline=job_start_time + 0.425 + exposure_time - latency)
+
+    # Unblank while the acquisition is active.
+    beam_unblank_time = time.perf_counter()
+    interface._set_beam_blanked(False)  # Command takes about 0.15 s. We know the beam is blank, no need to check.
+    beam_unblanked_time = time.perf_counter()
+
+    # Wait while the camera is recording. The deadline is measured from when the unblank command actually returned,
+    #  so the (variable) unblank latency is already accounted for.
+    # Notice we wait a little extra just to be sure the beam is unblanked for whole time the camera is recording.
+    wait_until(deadline=beam_unblanked_time + unblanked_time - latency)
+
+    # Re-blank the beam.
+    beam_reblank_time = time.perf_counter()
+    interface._set_beam_blanked(True)  # Command takes about 0.15 s
+    beam_reblanked_time = time.perf_counter()
+
+    # Let the main thread know we are done before we print, writing to the console is slow.
+    if done is not None:
+        done.set()
+
+    if verbose:
+        # Print everything at once, every print() costs us a (slow) write to the console.
+        print("-- Timing results from blanker_control() for acquisition #" + str(i) + " --\n"
+              + "\nIssued the command to unblanked the beam at: " + str(perf_counter_to_epoch(beam_unblank_time))
+              + "\nIssued the command to re-blanked the beam at: " + str(perf_counter_to_epoch(beam_reblank_time))
+              + "\nMeasured unblank latency: " + str(beam_unblanked_time - beam_unblank_time)
+              + "\nMeasured blank latency: " + str(beam_reblanked_time - beam_reblank_time)
+              # Less the extra unblanked time (which depends on whether the blanker latency has been calibrated)
+              + "\nTotal time spent with the beam unblanked: "
+              + str(beam_reblank_time - beam_unblanked_time - (unblanked_time - exposure_time)))
@@ -0,0 +1,48 @@
+"""
+ Author:  Michael Luciuk
+ Date:    Summer 2022
+"""
+
+import ctypes
+
+from typing import Any, Tuple
+
+
+def marshal_com_object(com_object) -> Tuple[ctypes.c_void_p, Any]:
+    """
+    Marshal a COM object so that it can be used from another thread (see unmarshal_com_object()).
+
+    COM objects (like the Thermo Fisher Instrument object) can only be called from the thread in which they were
+     created, or into which they were marshalled. Marshalling the existing object into a worker thread is much faster
+     than having the worker thread create its own with comtypes.client.CreateObject().
+
+    :param com_object: A comtypes COM interface pointer, such as that returned by comtypes.client.CreateObject().
+
+    :return: (stream, interface):
+        An opaque marshalled object, to be passed to unmarshal_com_object() from the thread where the COM object is
+         needed. The marshalled object can only be unmarshalled once.
+    """
+    interface = type(com_object)._type_
+    stream = ctypes.c_void_p()
+    ctypes.oledll.ole32.CoMarshalInterThreadInterfaceInStream(ctypes.byref(interface._iid_), com_object,
+                                                              ctypes.byref(stream))
+    return stream, interface
+
+
+def unmarshal_com_object(marshalled_com_object: Tuple[ctypes.c_void_p, Any]):
+    """
+    Unmarshal a COM object that was marshalled with marshal_com_object().
+
+    Must be called from the thread in which the COM object is to be used, and COM must already be initialized in that
+     thread (see comtypes.CoInitialize()).
+
+    :param marshalled_com_object: (stream, interface):
+        The marshalled object, as returned by marshal_com_object().
+
+    :return: A comtypes COM interface pointer, usable from the calling thread.
+    """
+    stream, interface = marshalled_com_object
+    com_object = ctypes.POINTER(interface)()
+    ctypes.oledll.ole32.CoGetInterfaceAndReleaseStream(stream, ctypes.byref(interface._iid_),
+                                                       ctypes.byref(com_object))
+    return com_object
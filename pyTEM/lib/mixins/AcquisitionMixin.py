@@ -3,15 +3,20 @@
  Date:    Summer 2022
 """
 
+import json
+import math
 import time
+import queue
+import statistics
+import atexit
 import warnings
 import pathlib
+import threading
 
 import comtypes.client as cc
 import numpy as np
-import multiprocessing as mp
 
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Union
 from numpy.typing import ArrayLike, NDArray
 
 # Mixins
@@ -23,9 +28,39 @@ from pyTEM.lib.mixins.VacuumMixin import VacuumMixin
 
 # Other library imports
 from pyTEM.lib.AcquisitionSeries import AcquisitionSeries
-from pyTEM.lib.Acquisition import Acquisition
-from pyTEM.lib.blanker_control import blanker_control
-from pyTEM.lib.tilt_control import tilt_control
+from pyTEM.lib.Acquisition import Acquisition, _read_tm_acquisition, _tm_image_to_array, _tm_image_shape
+from pyTEM.lib.blanker_control import blanker_worker
+from pyTEM.lib.com_marshalling import marshal_com_object
+from pyTEM.lib.perf_counter_to_epoch import perf_counter_to_epoch
+from pyTEM.lib.tilt_control import tilt_worker
+from pyTEM.lib.tem_tilt_speed import tem_tilt_speed
+
+# Index into the camera's supported binnings for each of the supported sampling options.
+_SAMPLING_INDICES = {'4k': 0,  # 4k images (4096 x 4096)
+                     '2k': 1,  # 2k images (2048 x 2048)
+                     '1k': 2,  # 1k images (1024 x 1024)
+                     '0.5k': 3}  # 0.5k images (512 x 512)
+
+# Blank and unblank commands each take about 0.15 seconds. For exposure times shorter than the time it takes to
+#  unblank and then re-blank the beam, the blanker can't keep up with the camera and the beam will stay unblanked for
+#  a little longer than the exposure itself.
+_MIN_BLANKER_OPTIMIZATION_EXPOSURE_TIME = 0.15 + 0.15
+
+# How long (in seconds, over and above the exposure time) we wait for the blanker and tilt threads to finish up after
+#  the acquisition command returns before we give up on them. They normally finish within a fraction of a second.
+_HELPER_THREAD_TIMEOUT = 5.0
+
+
+class CameraSelectionError(ValueError):
+    """
+    Raised when the requested camera is not available (and so could not be selected).
+    """
+
+
+class ExposureOutOfRangeError(ValueError):
+    """
+    Raised when the requested exposure time is not in the range supported by the camera.
+    """
 
 
 class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image shifts
@@ -39,23 +74,41 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
 
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
-        # Unresolved attribute warning suppression
+    if TYPE_CHECKING:
+        # Unresolved attribute warning suppression. Class annotations are evaluated when the class is defined, so
+        #  outside of type checking this would create (and throw away) an AdvancedInstrument object on every import.
         _tem_advanced: type(cc.CreateObject("TEMAdvancedScripting.AdvancedInstrument"))
-    except OSError:
-        pass
+    _cameras: Dict[str, Any]  # Thermo Fisher camera objects, keyed by camera name.
+    _camera_acquisition: Any  # The Thermo Fisher CameraSingleAcquisition object, see _get_camera_acquisition().
+    _selected_camera: str  # The name of the camera we last selected, see _select_camera().
+    _camera_settings: Any  # The selected camera's Thermo Fisher CameraSettings object, see _get_camera_settings().
+    _camera_capabilities: Dict[str, Dict[str, Any]]  # Static capabilities of each camera, keyed by camera name.
+    _last_camera_config: Tuple[str, str, Union[float, None], int]  # See _prepare_acquisition().
+    _blanker_thread: threading.Thread  # Persistent blanker control thread, see _start_blanker_worker().
+    _blanker_jobs: queue.Queue
+    _blanker_settings: Dict[str, Any]
+    _blanker_latency: Union[float, None]  # See calibrate_blanker_latency().
+    _tilt_thread: threading.Thread  # Persistent tilt control thread, see _start_tilt_worker().
+    _tilt_jobs: queue.Queue
+    _tilt_done: threading.Event
+    _tilt_settings: Dict[str, Any]
+    _blanker_done: threading.Event
+    _blanker_ready: threading.Event
+    _tilt_ready: threading.Event
 
     def acquisition_series(self,
                            num: int,
                            camera_name: str,
-                           exposure_time: float = 1,
+                           exposure_time: Union[float, None] = 1,
                            sampling: str = '1k',
                            readout_area: int = 0,
                            blanker_optimization: bool = True,
                            tilt_bounds: Union[ArrayLike, None] = None,
                            shifts: np.ndarray = None,
                            alphas: NDArray[float] = None,
-                           verbose: bool = False
+                           verbose: bool = False,
+                           callback: Union[Callable[[int, float, float, Acquisition], Any], None] = None,
+                           allocator: Union[Callable[[int], Any], None] = None
                            ) -> AcquisitionSeries:
         """
         Perform (and return the results of) an acquisition series.
@@ -75,6 +128,7 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
         :param exposure_time: float (optional; default is 1 second):
             Exposure time, in seconds. Please expose responsibly.
             About 0.015 seconds is the minimum exposure time required to get a clear image.
+            If None, the camera is left at its current exposure time.
         :param sampling: str (optional; default is '1k'):
             One of:
                 - '4k' for 4k images (4096 x 4096; sampling=1)
@@ -90,37 +144,53 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
         :param shifts: np.array of float tuples (optional; default is None):
             An array of tuples of the form (x, y) where x and y are the image shifts (in microns) to apply for the
              corresponding acquisition. If None, no image shifts will be applied.
-            If provided, len(shifts) must equal num.
+            If provided, shifts must have a shape of (num, 2).
             While there are other applications, image shifts can be used to compensation for lateral image shift while
              tilting or moving.
         :param alphas: np.array of floats (optional; default is None):
             An array of alpha tilt angles at which to perform the acquisitions. These are angles we tilt to and then
              stop and acquire. If you want to acquire and tilt simultaneously, please use tilt_bounds.
-            If provided, len(shifts) must equal num.
+            If provided, len(alphas) must equal num.
             One of alphas and tilt_bounds must be None.
         :param verbose: (optional; default is False):
            Print out extra information. Useful for debugging.
-
-        This function provides the following optional controls by means of multitasking. Utilizing either of these
-         functionalities results in the spawning of a separate parallel process to handle it.
-        # TODO: Eliminate the additional runtime caused by process creation and interface creation (maybe by switching
-            to threading, or perhaps creating the parallel process right when the user first connects to the microscope
-            and grabbing barriers from a Manager).
-            Illumination controls (including beam blanker controls) can only be called from the thread in which they
-            were marshalled, so right now we just perform all multitasking with a separate process. Maybe could use
-            pythoncom.CoMarshalInterThreadInterfaceInStream() to sort the issue.
+        :param callback: function (optional; default is None):
+            A function called as callback(i, core_acquisition_start_time, core_acquisition_end_time, acq) right after
+             each acquisition, where i is the index of the acquisition in the series, the two times are when the core
+             Thermo Fisher acquisition command was issued and returned (in seconds since the epoch, but measured with
+             time.perf_counter() so that their difference is accurate), and acq is the resulting Acquisition object.
+            When num > 1, the callback runs from a separate thread, alongside the next acquisition. Still, keep it
+             light: anything slower than an acquisition (like printing to the console, which can take tens of
+             milliseconds on Windows) will eventually hold up the series. If None and verbose is True, the core
+             acquisition timing is printed.
+        :param allocator: function (optional; default is None):
+            A function called as allocator(nbytes) that returns a writable buffer (anything supporting the buffer
+             protocol, e.g. a bytearray) of at least nbytes bytes. If provided, the images of the series are written
+             straight into this buffer, which holds the whole (num, height, width) image stack. It is requested once
+             per series, from the calling thread, as soon as the first image has been read out. This is useful when
+             the images are headed for a GPU: the allocator can hand out page-locked (pinned) host memory, which only
+             needs to be pinned once. Notice the Acquisition objects of the returned series are views of this buffer,
+             not copies. So if the allocator hands out the same buffer again, the next series overwrites the images of
+             the previous one: be sure you are done with them (e.g. they have been copied to the GPU) first. If None,
+             a new image stack is allocated for each series.
+
+        This function provides the following optional controls by means of multitasking. Each is handled from its own
+         persistent parallel thread, which is started the first time it is needed and then reused.
 
         :param blanker_optimization: bool (optional; default is True):
             When we call the core Thermo Fisher acquisition command, the camera is blind for
              one interval of exposure_time and then records for the next interval of exposure_time. Therefore, the full
              acquisition takes 2 * exposure_time + some communication delays. In order to minimize sample exposure
-             (material are often beam sensitive), we can opt to control the blanker in a parallel process where we
+             (material are often beam sensitive), we can opt to control the blanker in a parallel thread where we
              only unblank when the camera is actually recording.
             One of:
                 True: Minimize dose by means of blanking while the camera is not actually recording. The beam is only
                  unblanked for exposure_time + 0.05 seconds for each image.
                 False: Proceed without optimized blanker control, the beam will be unblanked for the full
                         2 * exposure_time + some communication delays.
+            For exposure times shorter than it takes to unblank and then re-blank the beam, which is about 0.3
+             seconds (please see calibrate_blanker_latency()), the beam will be unblanked for a little longer than the
+             exposure time. A warning is issued, but blanker optimization is still performed.
 
         :param tilt_bounds: array of float (optional; default is None):
             An array of alpha start-stop values for the tilt acquisition(s), in degrees.
@@ -134,24 +204,39 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
 
         :return: AcquisitionSeries:
             An acquisition series.
+        :raises CameraSelectionError: If the requested camera is not available.
+        :raises ExposureOutOfRangeError: If the requested exposure time is not supported by the requested camera.
+        :raises ValueError: If the requested sampling is not recognized.
         """
         if num <= 0:
             raise Exception("Error: acquisition_series() requires we perform at least one acquisition.")
 
+        # Catch typos before we touch the microscope, rather than silently acquiring at whatever sampling the camera
+        #  happens to be at.
+        if sampling not in _SAMPLING_INDICES:
+            raise ValueError("Sampling '" + str(sampling) + "' is not recognized. Please use one of: "
+                             + ", ".join(_SAMPLING_INDICES) + ".")
+
+        # The shifts and alphas are converted to lists of Python floats once, up front. Indexing into a numpy array
+        #  gives a numpy scalar, which would then need converting for the COM interface on every acquisition.
+        if shifts is not None and len(shifts) == 0:
+            shifts = None  # Empty list.
         if shifts is not None:
-            # Then we expect an array.
-            if len(shifts) == 0:
-                shifts = None  # Empty list.
-            if len(shifts) != num:
-                raise Exception("Error: The shifts array passed to acquisition_series() has a length of "
-                                + str(shifts) + ", but it should have a length of num=" + str(num) + ".")
+            # Then we expect a (num, 2) array.
+            shifts = np.asarray(shifts, dtype=float)
+            if shifts.shape != (num, 2):
+                raise Exception("Error: The shifts array passed to acquisition_series() has a shape of "
+                                + str(shifts.shape) + ", but it should have a shape of (num, 2)=(" + str(num) + ", 2).")
+            shifts = shifts.tolist()
+        if alphas is not None and len(alphas) == 0:
+            alphas = None  # Empty list.
         if alphas is not None:
-            # Then we expect an array, either of length 0 or num.
-            if len(alphas) == 0:
-                alphas = None  # Empty list.
-            if len(alphas) != num:
-                raise Exception("Error: The alphas array passed to acquisition_series() has a length of "
-                                + str(alphas) + ", but it should have a length of num=" + str(num) + ".")
+            # Then we expect an array of length num.
+            alphas = np.asarray(alphas, dtype=float)
+            if alphas.shape != (num,):
+                raise Exception("Error: The alphas array passed to acquisition_series() has a shape of "
+                                + str(alphas.shape) + ", but it should have a shape of (num,)=(" + str(num) + ",).")
+            alphas = alphas.tolist()
 
         # Find out if we are tilting.
         tilting = False  # Assume we are not tilting.
@@ -170,7 +255,62 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
             raise Exception("Error: acquisition_series() cannot take stationary images at alphas if also "
                             "tilting while acquiring. One of alphas and tilt_bounds should be None.")
 
-        blanker_process, tilt_process, barriers = None, None, None  # Warning suppression.
+        if exposure_time is None:
+            # Leave the camera at its current exposure time. We still need to know what that is in order to keep the
+            #  blanker and tilt threads synchronized with the camera.
+            update_exposure_time = False
+            exposure_time = self.get_exposure_time(camera_name)
+        else:
+            # The supported exposure time range is the same for every acquisition in the series, so only check it once.
+            #  The range is served from memory after the first time (see _get_camera_capabilities()), and the camera
+            #  selection that goes with it is remembered, so _prepare_acquisition() below doesn't select it again.
+            update_exposure_time = True
+            min_supported_exposure_time, max_supported_exposure_time = self.get_exposure_time_range(camera_name)
+            if not min_supported_exposure_time <= exposure_time <= max_supported_exposure_time:
+                raise ExposureOutOfRangeError("Unable to perform acquisition because the requested exposure time ("
+                                              + str(exposure_time) + ") is not in the supported range of "
+                                              + str(min_supported_exposure_time) + " to "
+                                              + str(max_supported_exposure_time) + " seconds. ")
+
+        tilt_speeds = None  # Warning suppression.
+        if tilting:
+            # Compute the tilt speed for each acquisition. This also checks the requested tilt speeds are supported, so
+            #  we do it now, before we touch the blanker, column valve, screen, or stage.
+            tilt_speeds = []
+            for i in range(num):
+                distance_tilting = abs(tilt_bounds[i + 1] - tilt_bounds[i])  # deg
+                # Convert to fractional speed as required by the stage setters.
+                tilt_speeds.append(tem_tilt_speed(distance_tilting / exposure_time))
+
+        if blanker_optimization:
+            # If the blanker latency has been calibrated, we know how long it actually takes to unblank and then
+            #  re-blank the beam. Otherwise, fall back on a typical value.
+            blanker_latency = self._get_blanker_latency()
+            if blanker_latency is not None:
+                min_blanker_optimization_exposure_time = 2 * blanker_latency
+            else:
+                min_blanker_optimization_exposure_time = _MIN_BLANKER_OPTIMIZATION_EXPOSURE_TIME
+
+            if exposure_time < min_blanker_optimization_exposure_time:
+                # The blanker can't bracket such a short exposure exactly. However, even then the beam is unblanked for
+                #  far less time than it would be without blanker optimization, so we warn but leave the choice alone.
+                warnings.warn("The exposure time (" + str(exposure_time) + " seconds) is shorter than it takes to "
+                              "unblank and then re-blank the beam (" + str(min_blanker_optimization_exposure_time)
+                              + " seconds), and so the beam will be unblanked for a little longer than the exposure "
+                                "time. Proceeding with blanker optimization anyway.")
+
+        # Starting the blanker and tilt threads (the first time around) is slow, so we get them going now and only wait
+        #  for them to be ready right before the first acquisition. In the meantime, we get everything else ready.
+        if blanker_optimization:
+            self._start_blanker_worker(verbose=verbose)
+        if tilting:
+            self._start_tilt_worker(verbose=verbose)
+
+        # The camera settings are the same for every acquisition in the series, so we only need to apply them once.
+        acquisition = self._prepare_acquisition(camera_name=camera_name, sampling=sampling,
+                                                exposure_time=exposure_time if update_exposure_time else None,
+                                                readout_area=readout_area)
+        acquire = acquisition.Acquire  # Resolve the acquisition command once, rather than once per acquisition.
 
         if verbose:
             print("Performing a series acquisition of " + str(num) + " acquisitions...")
@@ -178,7 +318,11 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
         # Make sure the beam is blank, column valve is open, and the screen is retracted.
         user_had_beam_blanked = self.beam_is_blank()
         if not user_had_beam_blanked:
-            self.blank_beam()
+            self._set_beam_blanked(True)  # We just checked, no need to check again.
+        # Without blanker optimization, re-blanking the beam after the last acquisition would only have it unblanked
+        #  again when we restore the user's blanker state. In that case, save ourselves the round-trip. Notice we still
+        #  blank the beam above, so the sample isn't exposed while we open the column valve, move the stage, etc.
+        skip_final_reblank = not user_had_beam_blanked and not blanker_optimization
         user_column_valve_position = self.get_column_valve_position()
         if user_column_valve_position == "closed":
             self.open_column_valve()
@@ -186,138 +330,99 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
         if user_screen_position == "inserted":
             self.retract_screen()
 
-        if blanker_optimization or tilting:
-            # We need an array of barriers that can be used to keep the blanking/tilting processes synchronized with
-            #  the main thread.
-            if verbose:
-                print("Multitasking required, creating an array of " + str(num) + " barriers.")
-
-            barriers = []
-            for i in range(num):
-                barriers.append(mp.Barrier(1 + blanker_optimization + tilting))  # 1 party for each process
-
         if blanker_optimization:
-            # Then we need to spawn a parallel process from which we control the blanker.
-            if verbose:
-                print("The user has requested we optimize the beam blanker, creating an separate blanking process...")
-
-            blanker_args = {'num_acquisitions': num, 'barriers': barriers, 'exposure_time': exposure_time,
-                            'verbose': verbose}
-            blanker_process = mp.Process(target=blanker_control, kwargs=blanker_args)
-
-            if verbose:
-                print("Starting the blanking process...")
-
-            blanker_process.start()
+            # The blanker settings are the same for every acquisition in the series, so we only need to share them once.
+            self._blanker_settings.update(exposure_time=exposure_time, verbose=verbose,
+                                          latency=self._get_blanker_latency())
 
         if tilting:
-            # Then we need to spawn a parallel process from which we can tilt
-            if verbose:
-                print("This acquisition series requires tilting, creating an separate tilt process...")
+            # Ensure we are at the starting tilt angle.
+            if not math.isclose(self.get_stage_position_alpha(), tilt_bounds[0], abs_tol=0.01):
+                if verbose:
+                    print("Moving the stage to the start angle, \u03B1=" + str(tilt_bounds[0]))
+                self.set_stage_position_alpha(alpha=tilt_bounds[0], speed=0.25, movement_type="go")
 
-            tilt_args = {'num_acquisitions': num, 'barriers': barriers, 'integration_time': exposure_time,
-                         'tilt_bounds': tilt_bounds, 'verbose': verbose}
-            tilt_process = mp.Process(target=tilt_control, kwargs=tilt_args)
+            self._tilt_settings.update(integration_time=exposure_time, verbose=verbose)
 
-            if verbose:
-                print("Starting the tilt process...")
+        if callback is None and verbose:
+            callback = _print_acquisition_timing
 
-            tilt_process.start()
+        self._wait_for_helpers_ready(blanker_optimization=blanker_optimization, tilting=tilting)
 
+        # Converting each image into an Acquisition object (and running the callback) takes a while, so we hand that
+        #  off to a separate thread and get on with the next acquisition. Only the COM reads need to happen here, in
+        #  the thread in which the acquisition was performed. With only one image (e.g. from acquisition()) there is
+        #  no next acquisition to get on with, so we skip the thread and convert the image right here afterwards.
         acq_series = AcquisitionSeries()
-        for i in range(num):
-
-            if shifts is not None:
-                # Apply the requested image shift.
-                self.set_image_shift(x=shifts[i, 0], y=shifts[i, 1])
+        frames, wrap_errors = queue.Queue(maxsize=2 if num > 1 else 0), []
+        image_stack = None  # We don't know the image shape until the first image arrives.
+        wrap_args, wrap_thread = None, None
 
-            if alphas is not None:
-                # Apply the requested alpha tilt, go slow to reduce unnecessary error.
-                self.set_stage_position_alpha(alpha=alphas[i], speed=0.25)
-
-            # Set up the acquisition.
-            acquisition = self._tem_advanced.Acquisitions.CameraSingleAcquisition
-            supported_cameras = acquisition.SupportedCameras
-
-            # Try and select the requested camera.
-            try:
-                acquisition.Camera = supported_cameras[[c.name for c in supported_cameras].index(str(camera_name))]
-            except ValueError:
-                raise Exception("Unable to perform acquisition because the requested camera (" + str(camera_name) + ") "
-                                "could not be selected. Please use the get_available_cameras() method to get a list of "
-                                "the available cameras.")
-
-            # Configure camera settings.
-            camera_settings = acquisition.CameraSettings
-
-            camera_settings.ReadoutArea = readout_area
-
-            supported_samplings = acquisition.CameraSettings.Capabilities.SupportedBinnings
-            if sampling == '4k':
-                camera_settings.Binning = supported_samplings[0]  # 4k images (4096 x 4096)
-            elif sampling == '2k':
-                camera_settings.Binning = supported_samplings[1]  # 2k images (2048 x 2048)
-            elif sampling == '1k':
-                camera_settings.Binning = supported_samplings[2]  # 1k images (1024 x 1024)
-            elif sampling == '0.5k':
-                camera_settings.Binning = supported_samplings[3]  # 0.5k images (512 x 512)
-            else:
-                print('Unknown sampling Type. Proceeding with the default sampling.')
-
-            min_supported_exposure_time, max_supported_exposure_time = self.get_exposure_time_range(camera_name)
-            if min_supported_exposure_time < exposure_time < max_supported_exposure_time:
-                camera_settings.ExposureTime = exposure_time
-            else:
-                raise Exception("Unable to perform acquisition because the requested exposure time (" +
-                                str(exposure_time) + ") is not in the supported range of "
-                                + str(min_supported_exposure_time) + " to " + str(max_supported_exposure_time)
-                                + " seconds. ")
-
-            if not blanker_optimization:
-                # No separate blanker control, we have to unblank ourselves.
-                self.unblank_beam()
-
-            if blanker_optimization or tilting:
-                barriers[i].wait()  # Wait for the blanker and/or tilt process(es) to synchronize.
-
-            # Actually perform an acquisition
-            core_acquisition_start_time = time.time()
-            acq = acquisition.Acquire()
-            core_acquisition_end_time = time.time()
-
-            if not blanker_optimization:
-                # No separate blanker control, we have to re-blank ourselves.
-                self.blank_beam()
-
-            acq_series.append(acq=Acquisition(acq))
-
-            if verbose:
-                print("\nAcquisition #: " + str(i))
-                print("Core acquisition started at: " + str(core_acquisition_start_time))
-                print("Core acquisition returned at: " + str(core_acquisition_end_time))
-                print("Core acquisition time: " + str(core_acquisition_end_time - core_acquisition_start_time))
+        try:
+            for i in range(num):
 
-        if blanker_optimization:
-            # Collect the beam blanker process.
-            blanker_process.join()
-
-        if tilting:
-            # Collect the tilting process
-            tilt_process.join()
+                if shifts is not None:
+                    # Apply the requested image shift.
+                    self.set_image_shift(x=shifts[i][0], y=shifts[i][1])
+
+                if alphas is not None:
+                    # Apply the requested alpha tilt, go slow to reduce unnecessary error.
+                    self.set_stage_position_alpha(alpha=alphas[i], speed=0.25)
+
+                acq, core_acquisition_start_time, core_acquisition_end_time = \
+                    self._acquire_once(acquire=acquire, blanker_optimization=blanker_optimization,
+                                       tilt=(tilt_bounds[i + 1], tilt_speeds[i]) if tilting else None,
+                                       reblank=not (skip_final_reblank and i == num - 1))
+
+                image_data, metadata = _read_tm_acquisition(acq)
+
+                if image_stack is None:
+                    # Allocate the image stack here rather than from the wrapper thread, so that the allocator is
+                    #  always called from the calling thread (which matters if it relies on thread-local state, like a
+                    #  CUDA context), and so that a bad allocator is reported before we expose the sample any further.
+                    image_shape, image_dtype = _tm_image_shape(image_data=image_data)
+                    image_stack = _allocate_image_stack(shape=(num,) + image_shape, dtype=image_dtype,
+                                                        allocator=allocator)
+                    wrap_args = (frames, acq_series, image_stack, callback, wrap_errors)
+                    if num > 1:
+                        wrap_thread = threading.Thread(target=_wrap_acquisitions, args=wrap_args, daemon=True)
+                        wrap_thread.start()
+
+                frames.put((i, perf_counter_to_epoch(core_acquisition_start_time),
+                            perf_counter_to_epoch(core_acquisition_end_time), image_data, metadata))
+
+                # Reading the acquisition out through the COM interface takes a while, so we only wait for the blanker
+                #  and tilt threads to finish up afterwards (they usually already have).
+                self._wait_for_helpers(blanker_optimization=blanker_optimization, tilting=tilting)
+
+                if len(wrap_errors) > 0:
+                    break  # The series is going to fail anyway, no sense exposing the sample any further.
+        finally:
+            # Wait for the rest of the images to be converted. Even if something went wrong, the wrapper thread is
+            #  waiting on us for the None, and would otherwise be stuck forever.
+            frames.put(None)
+            if wrap_thread is not None:
+                wrap_thread.join()
+            elif wrap_args is not None:
+                _wrap_acquisitions(*wrap_args)
 
         # Housekeeping: Leave the blanker, column value, and screen the way they were when we started.
         if user_column_valve_position == "closed":
             self.close_column_valve()
         if user_screen_position == "inserted":
             self.insert_screen()
-        if not user_had_beam_blanked:
-            self.unblank_beam()
+        # If we stopped the series early, the last acquisition re-blanked the beam even if we meant to skip that.
+        if not user_had_beam_blanked and (not skip_final_reblank or i < num - 1):
+            self._set_beam_blanked(False)  # We know the beam is blank, we left it that way.
+
+        if len(wrap_errors) > 0:
+            raise wrap_errors[0]
 
         return acq_series
 
     def acquisition(self,
                     camera_name: str,
-                    exposure_time: float = 1,
+                    exposure_time: Union[float, None] = 1,
                     sampling: str = '1k',
                     readout_area: int = 0,
                     blanker_optimization: bool = True,
@@ -336,6 +441,7 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
         :param exposure_time: float (optional; default is 1 second):
             Exposure time, in seconds. Please expose responsibly.
             About 0.015 seconds is the minimum exposure time required to get a clear image.
+            If None, the camera is left at its current exposure time.
         :param sampling: str (optional; default is '1k'):
             One of:
             - '4k' for 4k images (4096 x 4096; sampling=1)
@@ -355,20 +461,23 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
             this is the closest we can get to the actual acquisition time (the actual time the camera is recording
             useful information).
 
-        This function provides the following optional controls by means of multitasking. Utilizing either of these
-         functionalities results in the spawning of a separate parallel process to handle it.
+        This function provides the following optional controls by means of multitasking. Blanker optimization is
+         handled from a persistent parallel thread.
 
         :param blanker_optimization: bool (optional; default is True):
             When we call the core Thermo Fisher acquisition command, the camera is blind for
              one interval of exposure_time and then records for the next interval of exposure_time. Therefore, the full
              acquisition takes 2 * exposure_time + some communication delays. In order to minimize sample exposure
-             (material are often beam sensitive), we can opt to control the blanker in a parallel process where we
+             (material are often beam sensitive), we can opt to control the blanker in a parallel thread where we
              only unblank when the camera is actually recording.
             One of:
                 True: Minimize dose by means of blanking while the camera is not actually recording. The beam is only
                  unblanked for exposure_time + 0.05 seconds for each image.
                 False: Proceed without optimized blanker control, the beam will be unblanked for the full
                         2 * exposure_time + some communication delays.
+            For exposure times shorter than it takes to unblank and then re-blank the beam, which is about 0.3
+             seconds (please see calibrate_blanker_latency()), the beam will be unblanked for a little longer than the
+             exposure time. A warning is issued, but blanker optimization is still performed.
 
         :param tilt_destination: float (optional; default is None):
             The angle to which you would like to tilt to over the duration of the acquisition, in degrees.
@@ -380,6 +489,9 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
 
         :return:
             Acquisition: A single acquisition.
+        :raises CameraSelectionError: If the requested camera is not available.
+        :raises ExposureOutOfRangeError: If the requested exposure time is not supported by the requested camera.
+        :raises ValueError: If the requested sampling is not recognized.
         """
         if verbose:
             print("Performing an acquisition...")
@@ -398,6 +510,352 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
 
         return single_acq_series[0]
 
+    def _prepare_acquisition(self, camera_name: str, sampling: str, exposure_time: Union[float, None],
+                             readout_area: int):
+        """
+        Select the requested camera and apply the requested camera settings, getting everything ready to acquire.
+
+        Every camera setting is a call through the COM interface, so this should be done once per acquisition series
+         rather than once per acquisition. Also, we remember the last configuration we applied, and if the requested
+         configuration is the same then we don't bother applying it again. Notice this means changes made to the camera
+         settings from outside pyTEM (e.g. from the microscope user interface) may be missed.
+
+        :param camera_name: str:
+            The name of the camera you want use.
+        :param sampling: str:
+            One of '4k', '2k', '1k', or '0.5k'. Please refer to acquisition_series() for more information.
+        :param exposure_time: float:
+            Exposure time, in seconds. If None, the camera is left at its current exposure time.
+        :param readout_area: int:
+            One of 0 (full-size), 1 (half-size), or 2 (quarter-size).
+
+        :return: Thermo Fisher CameraSingleAcquisition object:
+            The acquisition object, ready to acquire.
+        """
+        if not isinstance(camera_name, str):
+            camera_name = str(camera_name)  # Once, up front, rather than in every lookup below.
+        acquisition = self._select_camera(camera_name)
+
+        camera_config = (camera_name, sampling, exposure_time, readout_area)
+        last_camera_config = getattr(self, "_last_camera_config", None)
+        if last_camera_config == camera_config:
+            return acquisition  # The camera is already configured as requested.
+
+        # Each setting is a separate (slow) COM call, and TEM Scripting has no way to apply them all at once. So, if
+        #  we configured this same camera last time, only write the settings that have changed.
+        if last_camera_config is None or last_camera_config[0] != camera_name:
+            last_camera_config = (None, None, None, None)
+        # Forget the last configuration until we are done, in case one of the writes fails part way through.
+        self._last_camera_config = None
+
+        # Configure camera settings.
+        camera_settings = self._get_camera_settings(camera_name)
+
+        if readout_area != last_camera_config[3]:
+            camera_settings.ReadoutArea = readout_area
+
+        if sampling != last_camera_config[1]:
+            binning = self._get_camera_capabilities(camera_name)['binnings'].get(sampling)
+            if binning is not None:
+                camera_settings.Binning = binning
+            else:
+                warnings.warn("Sampling '" + str(sampling) + "' is not supported by the " + str(camera_name)
+                              + " camera. Proceeding with the camera's current sampling.")
+
+        if exposure_time is not None and exposure_time != last_camera_config[2]:
+            camera_settings.ExposureTime = exposure_time
+
+        self._last_camera_config = camera_config
+        return acquisition
+
+    def _acquire_once(self, acquire: Callable[[], Any], blanker_optimization: bool,
+                      tilt: Union[Tuple[float, float], None] = None, reblank: bool = True) -> Tuple[Any, float, float]:
+        """
+        Perform a single acquisition with an already prepared acquisition object (see _prepare_acquisition()).
+
+        Notice we don't wait for the blanker and tilt threads to finish up, so that the caller can get on with reading
+         out the acquisition in the meantime. Be sure to call _wait_for_helpers() before the next acquisition.
+
+        :param acquire: function:
+            The Acquire method of the prepared acquisition object.
+        :param blanker_optimization: bool:
+            Whether to have the blanker thread unblank the beam only while the camera is recording. Please refer to
+             acquisition_series() for more information. If True, the blanker thread must already be running with the
+             right exposure time (see _start_blanker_worker()).
+        :param tilt: (float, float) (optional; default is None):
+            An (alpha, speed) tuple: the angle to which the tilt thread should tilt while the camera is recording (in
+             degrees), and the fractional tilt speed with which to do it (see tem_tilt_speed()). If provided, the tilt
+             thread must already be running with the right integration time (see _start_tilt_worker()). If None, we
+             don't tilt.
+        :param reblank: bool (optional; default is True):
+            Without blanker optimization, whether to re-blank the beam after acquiring. Ignored with blanker
+             optimization.
+
+        :return:
+            Thermo Fisher Acquisition object: The result of the acquisition.
+            float: The time.perf_counter() value at which the core Thermo Fisher acquisition command was issued.
+            float: The time.perf_counter() value at which the core Thermo Fisher acquisition command returned.
+        """
+        if not blanker_optimization:
+            # No separate blanker control, we have to unblank ourselves. We know the beam is blank, so there is no
+            #  need to check first.
+            self._set_beam_blanked(False)
+
+        # The blanker and tilt threads schedule their work relative to when we issue the acquisition command, which we
+        #  pass along so that it doesn't matter how long it takes for them to pick up the job.
+        core_acquisition_start_time = time.perf_counter()
+
+        if blanker_optimization:
+            # Have the blanker thread unblank the beam while the camera is recording.
+            self._blanker_done.clear()
+            self._blanker_jobs.put(core_acquisition_start_time)
+
+        if tilt is not None:
+            # Have the tilt thread tilt while the camera is recording.
+            self._tilt_done.clear()
+            self._tilt_jobs.put((core_acquisition_start_time,) + tuple(tilt))
+
+        # Actually perform an acquisition
+        acq = acquire()
+        core_acquisition_end_time = time.perf_counter()
+
+        if not blanker_optimization and reblank:
+            # No separate blanker control, we have to re-blank ourselves.
+            self._set_beam_blanked(True)
+
+        return acq, core_acquisition_start_time, core_acquisition_end_time
+
+    def _wait_for_helpers(self, blanker_optimization: bool, tilting: bool) -> None:
+        """
+        Wait for the blanker and tilt threads to finish up with the last acquisition (see _acquire_once()).
+
+        :param blanker_optimization: bool:
+            Whether the blanker thread was used for the last acquisition.
+        :param tilting: bool:
+            Whether the tilt thread was used for the last acquisition.
+
+        :return: None.
+        """
+        if blanker_optimization and not self._blanker_done.is_set():
+            # Wait for the blanker thread to re-blank the beam. If it is stuck (or has died), we can't just wait
+            #  forever with the beam unblanked.
+            if not self._blanker_done.wait(timeout=self._blanker_settings['exposure_time'] + _HELPER_THREAD_TIMEOUT):
+                self._set_beam_blanked(True)
+                raise Exception("Error: The blanker thread failed to re-blank the beam in time, the beam has been "
+                                "re-blanked from the main thread.")
+
+        if tilting and not self._tilt_done.is_set():
+            # Wait for the tilt thread to finish tilting.
+            if not self._tilt_done.wait(timeout=self._tilt_settings['integration_time'] + _HELPER_THREAD_TIMEOUT):
+                raise Exception("Error: The tilt thread failed to finish tilting in time.")
+
+    def _start_blanker_worker(self, verbose: bool = False) -> None:
+        """
+        Start the persistent parallel thread from which we control the blanker (if it isn't already running).
+
+        We don't wait for the thread to be ready, so that the caller can get on with other things in the meantime. Be
+         sure to call _wait_for_helpers_ready() before giving the thread any jobs.
+
+        Illumination controls can only be called from the thread in which they were marshalled, so we marshal our
+         Thermo Fisher Instrument object into the blanker thread (see _marshal_tem()). Starting the thread is still
+         slow, so rather than starting a new blanker thread for every acquisition series, we start one the first time
+         blanker optimization is requested and then reuse it. The thread is stopped automatically when the interpreter
+         exits.
+
+        We use a thread rather than a process because the blanker thread spends all its time either sleeping or waiting
+         on COM calls, and the acquisition command releases the GIL while the camera is recording. This spares us the
+         cost of starting a new process (and a new Python interpreter).
+
+        :param verbose: bool (optional; default is False):
+            Print out extra information. Useful for debugging.
+
+        :return: None.
+        """
+        if getattr(self, "_blanker_thread", None) is not None and self._blanker_thread.is_alive():
+            return  # Already running.
+
+        if verbose:
+            print("The user has requested we optimize the beam blanker, starting a separate blanking thread...")
+
+        self._blanker_jobs = queue.Queue()
+        self._blanker_settings = {'exposure_time': None, 'verbose': verbose}
+        self._blanker_done = threading.Event()
+        self._blanker_ready = threading.Event()
+        self._blanker_thread = threading.Thread(target=blanker_worker, daemon=True,
+                                                args=(self._blanker_jobs, self._blanker_done, self._blanker_ready,
+                                                      self._blanker_settings, self._marshal_tem()))
+        self._blanker_thread.start()
+        atexit.register(self._stop_blanker_worker)
+
+    def _stop_blanker_worker(self) -> None:
+        """
+        Stop the persistent blanker control thread, if it is running.
+        :return: None.
+        """
+        if getattr(self, "_blanker_thread", None) is None:
+            return
+
+        if self._blanker_thread.is_alive():
+            self._blanker_jobs.put(None)  # Poison pill.
+            self._blanker_thread.join(timeout=5)
+        self._blanker_thread = None
+
+    def calibrate_blanker_latency(self, num_toggles: int = 20, verbose: bool = False) -> float:
+        """
+        Measure how long it takes for blank/unblank commands to return, so that blanker optimization can compensate for
+         it (please refer to acquisition_series() for more information on blanker optimization).
+
+        The column valve is closed while we toggle the blanker, so the sample isn't exposed. The result is saved to
+         file, so you only need to calibrate once; uncalibrated, blanker optimization uses empirical timing.
+
+        :param num_toggles: int (optional; default is 20):
+            The number of times to unblank and then re-blank the beam. We use the median of all the measurements.
+        :param verbose: bool (optional; default is False):
+            Print out extra information. Useful for debugging.
+
+        :return: float:
+            The measured blanker latency, in seconds.
+        """
+        if num_toggles <= 0:
+            raise Exception("Error: calibrate_blanker_latency() requires we toggle the blanker at least once.")
+
+        # Make sure the beam is blank and the column valve is closed.
+        user_had_beam_blanked = self.beam_is_blank()
+        if not user_had_beam_blanked:
+            self._set_beam_blanked(True)
+        user_column_valve_position = self.get_column_valve_position()
+        if user_column_valve_position == "open":
+            self.close_column_valve()
+
+        # Time the bare blanker commands, the same ones the blanker thread uses (see _set_beam_blanked()).
+        latencies = []
+        for i in range(num_toggles):
+            for blanked in (False, True):
+                command_start_time = time.perf_counter()
+                self._set_beam_blanked(blanked)
+                latencies.append(time.perf_counter() - command_start_time)
+
+        # Housekeeping: Leave the blanker and column value the way they were when we started.
+        if user_column_valve_position == "open":
+            self.open_column_valve()
+        if not user_had_beam_blanked:
+            self._set_beam_blanked(False)
+
+        self._blanker_latency = statistics.median(latencies)
+        if verbose:
+            print("Measured blanker latency: " + str(self._blanker_latency) + " seconds (min: " + str(min(latencies))
+                  + ", max: " + str(max(latencies)) + ").")
+
+        try:
+            with open(_blanker_latency_file(), 'w') as f:
+                json.dump({'blanker_latency': self._blanker_latency}, f)
+        except OSError as e:
+            warnings.warn("Unable to save the blanker latency calibration to file: " + str(e))
+
+        return self._blanker_latency
+
+    def _get_blanker_latency(self) -> Union[float, None]:
+        """
+        Get the calibrated blanker latency (see calibrate_blanker_latency()). The calibration is only read from file
+         the first time it is requested.
+
+        :return: float or None:
+            The calibrated blanker latency, in seconds. None if the blanker latency has never been calibrated.
+        """
+        if not hasattr(self, "_blanker_latency"):
+            try:
+                with open(_blanker_latency_file(), 'r') as f:
+                    self._blanker_latency = float(json.load(f)['blanker_latency'])
+            except (OSError, ValueError, KeyError, TypeError):
+                self._blanker_latency = None  # Never calibrated (or the calibration file is unreadable).
+
+        return self._blanker_latency
+
+    def _marshal_tem(self):
+        """
+        Marshal our Thermo Fisher Instrument object so that it can be used from a worker thread. This is much faster
+         than having the worker thread create its own Instrument object.
+
+        :return: The marshalled Instrument object (see pyTEM.lib.com_marshalling.marshal_com_object()), or None if we
+         were unable to marshal it (in which case the worker thread will have to create its own).
+        """
+        try:
+            return marshal_com_object(self._tem)
+        except (AttributeError, OSError):
+            return None
+
+    def _start_tilt_worker(self, verbose: bool = False) -> None:
+        """
+        Start the persistent parallel thread from which we tilt while acquiring (if it isn't already running).
+
+        We don't wait for the thread to be ready, so that the caller can get on with other things in the meantime. Be
+         sure to call _wait_for_helpers_ready() before giving the thread any jobs.
+
+        Just like the blanker thread (see _start_blanker_worker()), we marshal our Thermo Fisher Instrument object into
+         the tilt thread, and rather than starting a new tilt thread for every acquisition series, we start one the
+         first time tilting is requested and then reuse it. The thread is stopped automatically when the interpreter
+         exits.
+
+        :param verbose: bool (optional; default is False):
+            Print out extra information. Useful for debugging.
+
+        :return: None.
+        """
+        if getattr(self, "_tilt_thread", None) is not None and self._tilt_thread.is_alive():
+            return  # Already running.
+
+        if verbose:
+            print("This acquisition series requires tilting, starting a separate tilt thread...")
+
+        self._tilt_jobs = queue.Queue()
+        self._tilt_settings = {'integration_time': None, 'verbose': verbose}
+        self._tilt_done = threading.Event()
+        self._tilt_ready = threading.Event()
+        self._tilt_thread = threading.Thread(target=tilt_worker, daemon=True,
+                                             args=(self._tilt_jobs, self._tilt_done, self._tilt_ready,
+                                                   self._tilt_settings, self._marshal_tem()))
+        self._tilt_thread.start()
+        atexit.register(self._stop_tilt_worker)
+
+    def _wait_for_helpers_ready(self, blanker_optimization: bool, tilting: bool) -> None:
+        """
+        Wait for the blanker and tilt threads to be ready to receive jobs (see _start_blanker_worker() and
+         _start_tilt_worker()). Returns right away if they already are.
+
+        :param blanker_optimization: bool:
+            Whether to wait for the blanker thread.
+        :param tilting: bool:
+            Whether to wait for the tilt thread.
+
+        :return: None.
+        """
+        if blanker_optimization:
+            # Don't proceed until the blanker thread is able to control the blanker.
+            while not self._blanker_ready.wait(timeout=0.1):
+                if not self._blanker_thread.is_alive():
+                    self._blanker_thread = None
+                    raise Exception("Error: The blanker control thread was unable to connect to the microscope.")
+
+        if tilting:
+            # Don't proceed until the tilt thread is able to control the stage.
+            while not self._tilt_ready.wait(timeout=0.1):
+                if not self._tilt_thread.is_alive():
+                    self._tilt_thread = None
+                    raise Exception("Error: The tilt control thread was unable to connect to the microscope.")
+
+    def _stop_tilt_worker(self) -> None:
+        """
+        Stop the persistent tilt control thread, if it is running.
+        :return: None.
+        """
+        if getattr(self, "_tilt_thread", None) is None:
+            return
+
+        if self._tilt_thread.is_alive():
+            self._tilt_jobs.put(None)  # Poison pill.
+            self._tilt_thread.join(timeout=5)
+        self._tilt_thread = None
+
     def print_camera_capabilities(self, camera_name: str) -> None:
         """
         Print out the capabilities of the requested camera.
@@ -408,30 +866,30 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
 
         :return: None.
         """
-        acquisition = self._tem_advanced.Acquisitions.CameraSingleAcquisition
-        supported_cameras = acquisition.SupportedCameras
-
         # Try and select the requested camera
         try:
-            acquisition.Camera = supported_cameras[[c.name for c in supported_cameras].index(str(camera_name))]
-        except ValueError:
+            camera_settings = self._get_camera_settings(camera_name)
+        except CameraSelectionError:
             warnings.warn("Unable to print camera capabilities because the requested camera (" + str(camera_name) +
                           ") could not be selected. Please use the get_available_cameras() method to confirm that the "
                           "requested camera is actually available.")
             return None
 
-        capabilities = acquisition.CameraSettings.Capabilities
+        # The supported binnings and exposure time range are already cached by camera name, so we only go through the
+        #  COM interface for the rest.
+        cached_capabilities = self._get_camera_capabilities(camera_name)
+        capabilities = camera_settings.Capabilities
 
         print("\n-- " + camera_name + " Capabilities --")
 
         print("\nSupported Samplings:")
-        for sampling in capabilities.SupportedBinnings:
+        for sampling in cached_capabilities['supported_binnings']:
             print(str(sampling.Height) + " x " + str(sampling.Width)
                   + " (Image size: " + str(int(4096 / sampling.Height)) + " x " + str(int(4096 / sampling.Width)) + ")")
 
         print("\nSupported Expose Time Range:")
-        exposure_time_range = capabilities.ExposureTimeRange
-        print(str(exposure_time_range.Begin) + " - " + str(exposure_time_range.End) + " s")
+        exposure_time_range = cached_capabilities['exposure_time_range']
+        print(str(exposure_time_range[0]) + " - " + str(exposure_time_range[1]) + " s")
 
         print("\nCamera Supports Dose Fractions:")
         print(capabilities.SupportsDoseFractions)
@@ -451,41 +909,265 @@ class AcquisitionMixin(ImageShiftMixin,     # So we can apply compensatory image
         print("\nCamera Supports Recording:")
         print(capabilities.SupportsRecording)
 
-    def get_available_cameras(self) -> List[str]:
+    def get_available_cameras(self, refresh: bool = False) -> List[str]:
         """
         Get a list of the available cameras.
+
+        The cameras are only looked up from the microscope the first time, subsequent requests are served from memory.
+
+        :param refresh: bool (optional; default is False):
+            Look up the available cameras from the microscope again, e.g. if a camera has been brought online since.
         :return: list of strings:
             A list with the names of the available cameras.
         """
-        acquisition = self._tem_advanced.Acquisitions.CameraSingleAcquisition
-        supported_cameras = acquisition.SupportedCameras
-        return [c.name for c in supported_cameras]
+        return list(self._get_cameras(refresh=refresh))
 
     def get_exposure_time_range(self, camera_name: str) -> Tuple[float, float]:
         """
         Get the supported exposure time range, in seconds.
 
+        The supported range is a static property of the camera, so it is only read from the microscope the first time
+         it is requested for each camera. Subsequent requests are served from memory.
+
         :param camera_name: str:
             The name of the camera of which you want to get the supported exposure time range. For a list of available
               cameras, please use the get_available_cameras() method.
         :return: float, float:
             The maximum and minimum supported exposure times.
+        :raises CameraSelectionError: If the requested camera is not available.
         """
-        acquisition = self._tem_advanced.Acquisitions.CameraSingleAcquisition
-        supported_cameras = acquisition.SupportedCameras
+        return self._get_camera_capabilities(camera_name)['exposure_time_range']
 
-        # Try and select the requested camera
+    def _get_camera_capabilities(self, camera_name: str) -> Dict[str, Any]:
+        """
+        Get the static capabilities of the requested camera.
+
+        Camera capabilities don't change, so they are only read from the microscope the first time they are requested
+         for each camera (at which point the camera is selected). Subsequent requests are served from memory.
+
+        :param camera_name: str:
+            The name of the camera of which you want the capabilities.
+        :return: dict:
+            A dictionary with the following keys:
+                'supported_binnings': tuple of Thermo Fisher Binning objects (4k images first).
+                'binnings': dict: The Thermo Fisher Binning object to use for each supported sampling option ('4k',
+                 '2k', '1k', and/or '0.5k').
+                'exposure_time_range': float, float: The minimum and maximum supported exposure times, in seconds.
+        :raises CameraSelectionError: If the requested camera is not available.
+        """
+        if not hasattr(self, "_camera_capabilities"):
+            self._camera_capabilities = {}
+        if not isinstance(camera_name, str):
+            camera_name = str(camera_name)
+        cached_capabilities = self._camera_capabilities.get(camera_name)
+        if cached_capabilities is not None:
+            return cached_capabilities
+
+        capabilities = self._get_camera_settings(camera_name).Capabilities
+        exposure_time_range = capabilities.ExposureTimeRange
+        supported_binnings = tuple(capabilities.SupportedBinnings)
+        self._camera_capabilities[camera_name] = {
+            'supported_binnings': supported_binnings,
+            'binnings': {sampling: supported_binnings[index] for sampling, index in _SAMPLING_INDICES.items()
+                         if index < len(supported_binnings)},
+            'exposure_time_range': (exposure_time_range.Begin, exposure_time_range.End)}
+
+        return self._camera_capabilities[camera_name]
+
+    def get_exposure_time(self, camera_name: str) -> float:
+        """
+        Get the exposure time the requested camera is currently set to, in seconds.
+
+        :param camera_name: str:
+            The name of the camera of which you want to get the current exposure time. For a list of available
+              cameras, please use the get_available_cameras() method.
+        :return: float:
+            The current exposure time.
+        """
+        return self._get_camera_settings(camera_name).ExposureTime
+
+    def _get_camera_acquisition(self):
+        """
+        Get the Thermo Fisher CameraSingleAcquisition object. Getting it costs us two calls through the COM interface,
+         so we only do so once and then keep it in memory.
+
+        :return: Thermo Fisher CameraSingleAcquisition object.
+        """
+        if not hasattr(self, "_camera_acquisition"):
+            self._camera_acquisition = self._tem_advanced.Acquisitions.CameraSingleAcquisition
+
+        return self._camera_acquisition
+
+    def _get_cameras(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get the available cameras.
+
+        Iterating through the supported cameras costs us a call through the COM interface for every camera. Cameras
+         rarely come and go while the microscope is running, so we only do this once and then keep the camera objects
+         in memory.
+
+        :param refresh: bool (optional; default is False):
+            Iterate through the supported cameras again, even if we already have.
+
+        :return: dict:
+            The Thermo Fisher camera objects, keyed by camera name (in the order the microscope lists them).
+        """
+        if refresh or not hasattr(self, "_cameras"):
+            supported_cameras = self._get_camera_acquisition().SupportedCameras
+            self._cameras = {camera.name: camera for camera in supported_cameras}
+
+        return self._cameras
+
+    def _get_camera_settings(self, camera_name: str):
+        """
+        Select the requested camera, and get its Thermo Fisher CameraSettings object.
+
+        Getting the CameraSettings object costs us a call through the COM interface, so we keep it in memory until a
+         different camera is selected.
+
+        :param camera_name: str:
+            The name of the camera of which you want the settings. For a list of available cameras, please use the
+             get_available_cameras() method.
+        :return: Thermo Fisher CameraSettings object:
+            The settings of the requested camera.
+        :raises CameraSelectionError: If the requested camera is not available.
+        """
+        acquisition = self._select_camera(camera_name)
+        if getattr(self, "_camera_settings", None) is None:
+            self._camera_settings = acquisition.CameraSettings
+
+        return self._camera_settings
+
+    def _select_camera(self, camera_name: str):
+        """
+        Select the requested camera.
+
+        The camera objects are kept in memory (see _get_cameras()), so normally this is just a dictionary lookup. If
+         the requested camera isn't one we know of, we check the supported cameras again before giving up, in case it
+         has become available since. Also, selecting a camera is slow, so we skip it if we already selected the
+         requested camera. Notice this means a camera selected from outside pyTEM (e.g. from the microscope user
+         interface) may be missed.
+
+        :param camera_name: str:
+            The name of the camera you want to select. For a list of available cameras, please use the
+             get_available_cameras() method.
+        :return: Thermo Fisher CameraSingleAcquisition object:
+            The acquisition object, with the requested camera selected.
+        :raises CameraSelectionError: If the requested camera is not available.
+        """
+        if not isinstance(camera_name, str):
+            camera_name = str(camera_name)
+        acquisition = self._get_camera_acquisition()
+
+        camera = self._get_cameras().get(camera_name)
+        if camera is None:
+            camera = self._get_cameras(refresh=True).get(camera_name)
+        if camera is None:
+            raise CameraSelectionError("The requested camera (" + camera_name + ") could not be selected. Please use "
+                                       "the get_available_cameras() method to get a list of the available cameras.")
+
+        if getattr(self, "_selected_camera", None) != camera_name:
+            acquisition.Camera = camera
+            self._selected_camera = camera_name
+            self._camera_settings = None  # The camera settings we have are for the previously selected camera.
+            self._last_camera_config = None  # As is the configuration we last applied.
+
+        return acquisition
+
+
+def _blanker_latency_file() -> pathlib.Path:
+    """
+    :return: pathlib.Path: The file in which we save the blanker latency calibration (see calibrate_blanker_latency()).
+    """
+    return pathlib.Path(__file__).resolve().parents[1] / "blanker_latency.json"
+
+
+def _wrap_acquisitions(frames: queue.Queue, acq_series: AcquisitionSeries, image_stack: np.ndarray,
+                       callback: Union[Callable, None], errors: List[BaseException]) -> None:
+    """
+    Support acquisition_series() by converting acquired images into Acquisition objects from a parallel thread.
+
+    :param frames: queue.Queue:
+        The queue from which we receive the acquired images. Each item is an (i, core_acquisition_start_time,
+         core_acquisition_end_time, image_data, metadata) tuple, where image_data and metadata are as returned by
+         _read_tm_acquisition(). Put None on the queue once all the images have been acquired.
+    :param acq_series: AcquisitionSeries:
+        The series to which we append the resulting Acquisition objects, in order, once all the images have arrived.
+    :param image_stack: numpy.ndarray:
+        The (num, height, width) image stack into which to write the images, see _allocate_image_stack(). Rather than
+         allocating a new array for every image, each Acquisition object holds a view of its own frame. This way, the
+         images of the series are neighbours in memory.
+    :param callback: function or None:
+        The per-acquisition callback, please refer to acquisition_series().
+    :param errors: list:
+        Any exception raised while converting an image (or by the callback) is appended here so it can be re-raised
+         from the main thread, which then stops acquiring. After an error, we keep emptying the queue (so the main
+         thread doesn't get stuck) but stop converting images.
+
+    :return: None.
+    """
+    acqs = []  # Every image is a view of the same stack, so there is no need for append() to check each one.
+    while True:
+        frame = frames.get()
+        if frame is None:
+            break  # We are done.
+        if len(errors) > 0:
+            continue  # Something already went wrong, just empty the queue.
+
+        i, core_acquisition_start_time, core_acquisition_end_time, image_data, metadata = frame
         try:
-            acquisition.Camera = supported_cameras[[c.name for c in supported_cameras].index(str(camera_name))]
-        except ValueError:
-            warnings.warn("Unable to get the exposure time range because the requested camera (" + str(camera_name) +
-                          ") could not be selected. Please use the get_available_cameras() method to confirm that the "
-                          "requested camera is actually available.")
-            return np.nan, np.nan
+            _tm_image_to_array(image_data=image_data, out=image_stack[i])
+
+            acq = Acquisition(image_stack[i])
+            acq._set_metadata(metadata=metadata)
+            acqs.append(acq)
+
+            if callback is not None:
+                callback(i, core_acquisition_start_time, core_acquisition_end_time, acq)
+        except BaseException as e:
+            errors.append(e)
+
+    acq_series._extend_unchecked(acqs=acqs)
+
+
+def _allocate_image_stack(shape: Tuple[int, int, int], dtype,
+                          allocator: Union[Callable[[int], Any], None] = None) -> np.ndarray:
+    """
+    Allocate the image stack for an acquisition series, see _wrap_acquisitions().
+
+    :param shape: (int, int, int):
+        The image stack shape: (num, height, width).
+    :param dtype: The image stack datatype.
+    :param allocator: function (optional; default is None):
+        A user-provided allocator from which to get the image stack, please refer to acquisition_series(). It is
+         called as allocator(nbytes), and should return a writable buffer of at least nbytes bytes, which we wrap
+         without copying. If None, we allocate a new image stack.
 
-        exposure_time_range = acquisition.CameraSettings.Capabilities.ExposureTimeRange
+    :return: numpy.ndarray: The (num, height, width) image stack. Notice it is uninitialized.
+    """
+    dtype = np.dtype(dtype)
+    if allocator is None:
+        return np.empty(shape=shape, dtype=dtype)
+
+    count = math.prod(shape)
+    buffer = allocator(count * dtype.itemsize)
+    image_stack = np.frombuffer(buffer, dtype=dtype, count=count).reshape(shape)
+    if not image_stack.flags.writeable:
+        raise Exception("Error: The buffer returned by the acquisition_series() allocator is read-only.")
+    return image_stack
 
-        return exposure_time_range.Begin, exposure_time_range.End
+
+def _print_acquisition_timing(i: int, core_acquisition_start_time: float, core_acquisition_end_time: float,
+                              acq: Acquisition) -> None:
+    """
+    The default (verbose) acquisition_series() callback, print out the core acquisition timing.
+
+    Everything is printed with a single call because every print() costs us a (slow) write to the console.
+    """
+    print("\nAcquisition #: " + str(i)
+          + "\nCore acquisition started at: " + str(core_acquisition_start_time)
+          + "\nCore acquisition returned at: " + str(core_acquisition_end_time)
+          + "\nCore acquisition time: " + str(core_acquisition_end_time - core_acquisition_start_time))
 
 
 class AcquisitionInterface(AcquisitionMixin):
@@ -502,6 +1184,18 @@ class AcquisitionInterface(AcquisitionMixin):
             raise e
 
 
+def _print_overall_timing(requested_exposure_time: float, overall_start_time: float,
+                          overall_stop_time: float) -> None:
+    """
+    Print out the overall timing of an acquisition() call. Everything is printed with a single call, so that printing
+     doesn't skew the timing of whatever comes next.
+    """
+    print("\nRequested Exposure time: " + str(requested_exposure_time) + "\n"
+          + "\nOverall acquisition() method call started at: " + str(overall_start_time)
+          + "\nOverall acquisition() method returned at: " + str(overall_stop_time)
+          + "\nTotal overall time spent in acquisition(): " + str(overall_stop_time - overall_start_time))
+
+
 def acquisition_testing():
     """
     Test the acquisition() method.
@@ -516,16 +1210,13 @@ def acquisition_testing():
 
     """ Perform an acquisition with no multitasking """
     print("\n\n## Performing an acquisition with no multitasking ##")
-    overall_start_time = time.time()
+    overall_start_time = time.perf_counter()
     test_acq = interface.acquisition(camera_name="BM-Ceta", exposure_time=requested_exposure_time, sampling='4k',
                                      blanker_optimization=False, tilt_destination=None, verbose=True)
-    overall_stop_time = time.time()
-
-    print("\nRequested Exposure time: " + str(requested_exposure_time))
+    overall_stop_time = time.perf_counter()
 
-    print("\nOverall acquisition() method call started at: " + str(overall_start_time))
-    print("Overall acquisition() method returned at: " + str(overall_stop_time))
-    print("Total overall time spent in acquisition(): " + str(overall_stop_time - overall_start_time))
+    _print_overall_timing(requested_exposure_time=requested_exposure_time, overall_start_time=overall_start_time,
+                          overall_stop_time=overall_stop_time)
 
     print(test_acq.get_image())
     test_acq.show_image()
@@ -537,16 +1228,13 @@ def acquisition_testing():
 
     """ Perform an acquisition with blanker optimization but no tilting """
     print("\n\n## Performing an acquisition with blanking optimization but no tilting ##")
-    overall_start_time = time.time()
+    overall_start_time = time.perf_counter()
     test_acq = interface.acquisition(camera_name="BM-Ceta", exposure_time=requested_exposure_time, sampling='4k',
                                      blanker_optimization=True, tilt_destination=None, verbose=True)
-    overall_stop_time = time.time()
+    overall_stop_time = time.perf_counter()
 
-    print("\nRequested Exposure time: " + str(requested_exposure_time))
-
-    print("\nOverall acquisition() method call started at: " + str(overall_start_time))
-    print("Overall acquisition() method returned at: " + str(overall_stop_time))
-    print("Total overall time spent in acquisition(): " + str(overall_stop_time - overall_start_time))
+    _print_overall_timing(requested_exposure_time=requested_exposure_time, overall_start_time=overall_start_time,
+                          overall_stop_time=overall_stop_time)
 
     print(test_acq.get_image())
     test_acq.show_image()
@@ -560,16 +1248,13 @@ def acquisition_testing():
     # print("\n\n## Performing an acquisition with titling (0 deg -> 2 deg) but no blanker optimization ##")
     # interface.set_stage_position_alpha(alpha=0)
     #
-    # overall_start_time = time.time()
+    # overall_start_time = time.perf_counter()
     # test_acq = interface.acquisition(camera_name="BM-Ceta", exposure_time=requested_exposure_time, sampling='1k',
     #                                  blanker_optimization=False, tilt_destination=1, verbose=True)
-    # overall_stop_time = time.time()
-    #
-    # print("\nRequested Exposure time: " + str(requested_exposure_time))
+    # overall_stop_time = time.perf_counter()
     #
-    # print("\nOverall acquisition() method call started at: " + str(overall_start_time))
-    # print("Overall acquisition() method returned at: " + str(overall_stop_time))
-    # print("Total overall time spent in acquisition(): " + str(overall_stop_time - overall_start_time))
+    # _print_overall_timing(requested_exposure_time=requested_exposure_time, overall_start_time=overall_start_time,
+    #                       overall_stop_time=overall_stop_time)
     #
     # print(test_acq.get_image())
     # test_acq.show_image()
@@ -579,16 +1264,13 @@ def acquisition_testing():
     # print("\n\n## Performing an acquisition with titling (0 deg -> 2 deg) AND blanker optimization ##")
     # interface.set_stage_position_alpha(alpha=0)
     #
-    # overall_start_time = time.time()
+    # overall_start_time = time.perf_counter()
     # test_acq = interface.acquisition(camera_name="BM-Ceta", exposure_time=requested_exposure_time, sampling='1k',
     #                                  blanker_optimization=True, tilt_destination=1, verbose=True)
-    # overall_stop_time = time.time()
-    #
-    # print("\nRequested Exposure time: " + str(requested_exposure_time))
+    # overall_stop_time = time.perf_counter()
     #
-    # print("\nOverall acquisition() method call started at: " + str(overall_start_time))
-    # print("Overall acquisition() method returned at: " + str(overall_stop_time))
-    # print("Total overall time spent in acquisition(): " + str(overall_stop_time - overall_start_time))
+    # _print_overall_timing(requested_exposure_time=requested_exposure_time, overall_start_time=overall_start_time,
+    #                       overall_stop_time=overall_stop_time)
     #
     # print(test_acq.get_image())
     # test_acq.show_image()
@@ -598,7 +1280,7 @@ def acquisition_series_testing():
     """
     Test the acquisition series method.
     """
-    out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve().parent.resolve() / "test" / "test_images"
+    out_dir = pathlib.Path(__file__).resolve().parents[2] / "test" / "test_images"
     print("out_dir: " + str(out_dir))
 
     requested_exposure_time = 1  # s
@@ -656,7 +1338,7 @@ def acquisition_series_testing():
     """ Perform an acquisition with tilting but no blanker optimization """
     # print("\n\n## Performing an acquisition with titling (-2 deg -> 2 deg) but no blanker optimization ##")
     #
-    # tilt_bounds = np.asarray([-2, -1, 0, 1, 2])
+    # tilt_bounds = np.arange(-2, 3, dtype=np.float32)
     #
     # acq_series = interface.acquisition_series(num=len(tilt_bounds) - 1, camera_name="BM-Ceta",
     #                                           exposure_time=requested_exposure_time,
@@ -678,8 +1360,8 @@ def acquisition_series_testing():
     """ Perform an acquisition with both tilting and blanker optimization """
     # print("\n\n## Performing an acquisition with titling (-2 deg -> 2 deg) AND blanker optimization "
     #       "(with dummy shifts) ##")
-    # tilt_bounds = np.ararray([-2, -1, 0, 1, 2])
-    # shifts_ = np.full(shape=len(tilt_bounds - 1), dtype=(float, 2), fill_value=0.0)
+    # tilt_bounds = np.arange(-2, 3, dtype=np.float32)
+    # shifts_ = np.zeros(shape=(len(tilt_bounds) - 1, 2), dtype=np.float32)
     #
     # acq_series = interface.acquisition_series(num=len(tilt_bounds) - 1, camera_name="BM-Ceta",
     #                                           exposure_time=requested_exposure_time,
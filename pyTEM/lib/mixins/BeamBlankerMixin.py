@@ -5,17 +5,17 @@
 
 import comtypes.client as cc
 
+from typing import TYPE_CHECKING
+
 
 class BeamBlankerMixin:
     """
     Microscope beam blanker controls, including functions to blank and unblank the beam.
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
+    if TYPE_CHECKING:
         # Unresolved attribute warning suppression
         _tem: type(cc.CreateObject("TEMScripting.Instrument"))
-    except OSError:
-        pass
 
     def beam_is_blank(self) -> bool:
         """
@@ -26,28 +26,70 @@ class BeamBlankerMixin:
         """
         return self._tem.Illumination.BeamBlanked
 
-    def blank_beam(self) -> None:
+    def blank_beam(self, verbose: bool = True) -> None:
         """
         Blank the beam.
+        :param verbose: bool (optional; default is True):
+            Print a message if the beam is already blanked. Printing to the console is slow, consider turning this off
+             when blanking from a loop.
         :return: None.
         """
         if self.beam_is_blank():
-            print("The beam is already blanked.. no changes made.")
+            if verbose:
+                print("The beam is already blanked.. no changes made.")
             return
 
         # Go ahead and blank the beam
-        self._tem.Illumination.BeamBlanked = True
+        self._set_beam_blanked(True)
 
-    def unblank_beam(self) -> None:
+    def unblank_beam(self, verbose: bool = True) -> None:
         """
         Unblank the beam.
+        :param verbose: bool (optional; default is True):
+            Print a message if the beam is already unblanked. Printing to the console is slow, consider turning this
+             off when unblanking from a loop.
         :return: None.
         """
         if not self.beam_is_blank():
-            print("The beam is already unblanked.. no changes made.")
+            if verbose:
+                print("The beam is already unblanked.. no changes made.")
             return
 
-        self._tem.Illumination.BeamBlanked = False
+        self._set_beam_blanked(False)
+
+    def force_blank_beam(self) -> None:
+        """
+        Blank the beam, without first checking whether it already is.
+
+        This saves a (slow) call through the COM interface, and so is helpful where the blanker state is already known
+         or where timing matters. Blanking an already blanked beam does no harm.
+
+        :return: None.
+        """
+        self._set_beam_blanked(True)
+
+    def force_unblank_beam(self) -> None:
+        """
+        Unblank the beam, without first checking whether it already is.
+
+        This saves a (slow) call through the COM interface, and so is helpful where the blanker state is already known
+         or where timing matters. Unblanking an already unblanked beam does no harm.
+
+        :return: None.
+        """
+        self._set_beam_blanked(False)
+
+    def _set_beam_blanked(self, blanked: bool) -> None:
+        """
+        Blank or unblank the beam without first checking whether it already is. Unlike blank_beam() and unblank_beam(),
+         this is a single call through the COM interface, which is helpful where the blanker state is already known or
+         where timing matters (e.g. while acquiring).
+
+        :param blanked: bool:
+            True to blank the beam, False to unblank it.
+        :return: None.
+        """
+        self._tem.Illumination.BeamBlanked = blanked
 
 
 class BeamBlankerInterface(BeamBlankerMixin):
@@ -55,7 +97,16 @@ class BeamBlankerInterface(BeamBlankerMixin):
     A microscope interface with only beam blanker controls.
     """
 
-    def __init__(self):
+    def __init__(self, tem=None):
+        """
+        :param tem: Thermo Fisher Instrument object (optional; default is None):
+            An existing Thermo Fisher Instrument object to use (e.g. one marshalled in from another thread). If None,
+             we create our own.
+        """
+        if tem is not None:
+            self._tem = tem
+            return
+
         try:
             self._tem = cc.CreateObject("TEMScripting.Instrument")
         except OSError as e:
@@ -7,6 +7,7 @@ import warnings
 import numpy as np
 import comtypes.client as cc
 
+from typing import TYPE_CHECKING, Any
 from numpy.typing import ArrayLike
 
 from pyTEM.lib.mixins.ModeMixin import ModeMixin
@@ -18,12 +19,12 @@ class ImageShiftMixin(ModeMixin):
 
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
+    if TYPE_CHECKING:
         # Unresolved attribute warning suppression
         _tem: type(cc.CreateObject("TEMScripting.Instrument"))
-    except OSError:
-        pass
     _image_shift_matrix: type(np.empty(shape=(2, 2)))
+    _image_shift_matrix_inv: type(np.empty(shape=(2, 2)))  # See _set_image_shift_matrix().
+    _image_shift_vector: Any  # A ThermoFisher Vector object, reused by set_image_shift().
 
     # Note: For precise shifting, an offset vector is required to account for hysteresis in the len's magnets. However,
     #  this is negligible for most applications.
@@ -43,24 +44,40 @@ class ImageShiftMixin(ModeMixin):
             The new 2x2 matrix used to translate between the stage-plane and the image-plane.
         :return: None.
         """
-        self._stage_position = a
+        self._image_shift_matrix = np.asarray(a, dtype=float)
+        # The matrix is rarely updated, but we need its inverse every time we shift, so invert it once, here.
+        self._image_shift_matrix_inv = np.linalg.inv(self._image_shift_matrix)
+
+    def _get_image_shift_matrix_inv(self) -> np.ndarray:
+        """
+        :return: numpy.ndarray:
+            The inverse of the image shift matrix, used to translate from the image-plane back to the stage-plane.
+        """
+        if not hasattr(self, "_image_shift_matrix_inv"):
+            # The matrix was set without going through _set_image_shift_matrix().
+            self._image_shift_matrix_inv = np.linalg.inv(self.get_image_shift_matrix())
+        return self._image_shift_matrix_inv
 
     def get_image_shift(self) -> np.array:
         """
         :return: [x, y]: 2-element numpy.array:
             The x and y values of the image shift, in micrometres.
         """
-        if self.get_projection_mode() == "imaging" and self.get_projection_submode() != "SA":
-            warnings.warn("Image shift functions only tested for magnifications in SA range (4300 x -> 630 kx Zoom), "
-                          "but the current projection submode is " + self._tem.Projection.SubModeString +
-                          ". Magnifications in this range may require a different transformation matrix.")
+        if self.get_projection_mode() == "imaging":
+            submode = self.get_projection_submode()  # Only go through the COM interface once.
+            if submode != "SA":
+                warnings.warn("Image shift functions only tested for magnifications in SA range (4300 x -> 630 kx "
+                              "Zoom), but the current projection submode is " + submode +
+                              ". Magnifications in this range may require a different transformation matrix.")
 
         image_shift = self._tem.Projection.ImageShift
 
         # Notice we need to use the image shift matrix to translate from the image plane back to the stage plane.
         # Image shift along y is in the wrong direction (IDK why), for now we just invert the user input.
-        temp = 1e6 * np.matmul(self.get_image_shift_matrix(), np.asarray([image_shift.X, image_shift.Y]))
-        return np.asarray([temp[0], - temp[1]])
+        # The matrix-vector product is only four multiplications, which is quicker by hand than through np.matmul().
+        a = self.get_image_shift_matrix()
+        bx, by = image_shift.X, image_shift.Y
+        return np.asarray([1e6 * (a[0, 0] * bx + a[0, 1] * by), - 1e6 * (a[1, 0] * bx + a[1, 1] * by)])
 
     def set_image_shift(self, x: float = None, y: float = None) -> None:
         """
@@ -73,27 +90,42 @@ class ImageShiftMixin(ModeMixin):
 
         :return: None.
         """
-        if self.get_projection_submode() != "SA":
+        # This is called for every acquisition in a series with image shifts, and every COM call is a (slow)
+        #  cross-process round trip, so we only read what we need, once.
+        submode = self.get_projection_submode()
+        if submode != "SA":
             warnings.warn("Image shift functions only tested for magnifications in SA range (4300 x -> 630 kx Zoom), "
-                          "but the current projection submode is " + self._tem.Projection.SubModeString +
+                          "but the current projection submode is " + submode +
                           ". Magnifications in this range may require a different transformation matrix.")
 
-        a = self.get_image_shift_matrix()
-
-        u = self.get_image_shift()  # Start from the current image shift location
+        # The 2x2 matrix-vector products below are only four multiplications each, which is quicker by hand than
+        #  through np.matmul().
+        if x is None or y is None:
+            # Start from the current image shift location, in the image plane (m). The ThermoFisher Vector object we
+            #  read it from then doubles as the one we use to perform the shift.
+            new_image_shift = self._tem.Projection.ImageShift
+            a = self.get_image_shift_matrix()
+            bx, by = new_image_shift.X, new_image_shift.Y
+            ux, uy = a[0, 0] * bx + a[0, 1] * by, a[1, 0] * bx + a[1, 1] * by
+        else:
+            # We only need a ThermoFisher Vector object to perform the shift with, so reuse the one from last time
+            #  rather than reading a new one just to overwrite it.
+            new_image_shift = getattr(self, "_image_shift_vector", None)
+            if new_image_shift is None:
+                new_image_shift = self._tem.Projection.ImageShift
 
         if x is not None:
-            u[0] = x / 1e6  # Update our x-value (convert um -> m)
+            ux = x / 1e6  # Update our x-value (convert um -> m)
         if y is not None:
             # Image shift along y is in the wrong direction (IDK why), for now we just invert the user input.
-            u[1] = -y / 1e6  # update our y-value (convert um -> m)
+            uy = -y / 1e6  # update our y-value (convert um -> m)
 
         # Translate back to the microscope plane and perform the shift
-        u_prime = np.matmul(np.linalg.inv(a), u)
-        new_image_shift = self._tem.Projection.ImageShift  # Just to get the required ThermoFisher Vector object
-        new_image_shift.X = u_prime[0]
-        new_image_shift.Y = u_prime[1]
+        a_inv = self._get_image_shift_matrix_inv()
+        new_image_shift.X = a_inv[0, 0] * ux + a_inv[0, 1] * uy
+        new_image_shift.Y = a_inv[1, 0] * ux + a_inv[1, 1] * uy
         self._tem.Projection.ImageShift = new_image_shift
+        self._image_shift_vector = new_image_shift
 
 
 class ImageShiftInterface(ImageShiftMixin):
@@ -7,8 +7,35 @@ import math
 import warnings
 import comtypes.client as cc
 
+from typing import TYPE_CHECKING
+
 from pyTEM.lib.mixins.ModeMixin import ModeMixin
 
+# Available magnifications [x Zoom], in order. When in TEM imaging mode, the magnification index is the (1-based)
+#  position in _TEM_IMAGING_MAGNIFICATIONS.
+_TEM_IMAGING_MAGNIFICATIONS = (25.0, 34.0, 46.0, 62.0, 84.0, 115.0, 155.0, 210.0, 280.0, 380.0,
+                               510.0, 700.0, 940.0, 1300.0, 1700.0, 2300.0, 2050.0, 2600.0, 3300.0,
+                               4300.0, 5500.0, 7000.0, 8600.0, 11000.0, 14000.0, 17500.0, 22500.0,
+                               28500.0, 36000.0, 46000.0, 58000.0, 74000.0, 94000.0, 120000.0,
+                               150000.0, 190000.0, 245000.0, 310000.0, 390000.0, 500000.0, 630000.0,
+                               650000.0, 820000.0, 1050000.0)
+_STEM_IMAGING_MAGNIFICATIONS = (4300.0, 5500.0, 7000.0, 8600.0, 11000.0, 14000.0, 17500.0, 22500.0,
+                                28500.0, 36000.0, 46000.0, 58000.0, 74000.0, 94000.0, 120000.0,
+                                150000.0, 190000.0, 245000.0, 310000.0, 390000.0, 500000.0, 630000.0)
+_STEM_DIFFRACTION_MAGNIFICATIONS = (320.0, 450.0, 630.0, 900.0, 1250.0, 1800.0, 2550.0, 3600.0, 5100.0, 7200.0,
+                                    10000.0, 14500.0, 20500.0, 28500.0, 41000.0, 57000.0, 81000.0, 115000.0,
+                                    160000.0, 230000.0, 320000.0, 460000.0, 650000.0, 920000.0, 1300000.0,
+                                    5000, 7000, 9900, 14000, 20000, 28000, 40000, 56000, 79000, 110000.0,
+                                    160000.0, 225000.0, 320000.0, 450000.0, 630000.0, 900000.0, 1250000.0,
+                                    1800000.0, 2550000.0, 3600000.0, 5100000.0, 7200000.0, 10000000.0,
+                                    14500000.0, 20500000.0, 28500000.0, 41000000.0, 57000000.0, 81000000.0,
+                                    115000000.0, 160000000.0, 230000000.0, 320000000.0)
+
+# The TEM imaging table never changes, so we only format it once.
+_TEM_IMAGING_MAGNIFICATION_TABLE = "\n".join(
+    ["{:<20} {:<20}".format("Magnification Index", "Magnification [x Zoom]")]
+    + ["{:<20} {:<20}".format(i + 1, magnification) for i, magnification in enumerate(_TEM_IMAGING_MAGNIFICATIONS)])
+
 
 class MagnificationMixin(ModeMixin):
     """
@@ -17,11 +44,9 @@ class MagnificationMixin(ModeMixin):
 
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
+    if TYPE_CHECKING:
         # Unresolved attribute warning suppression
         _tem: type(cc.CreateObject("TEMScripting.Instrument"))
-    except OSError:
-        pass
 
     def get_magnification(self) -> float:
         """
@@ -29,16 +54,19 @@ class MagnificationMixin(ModeMixin):
             The current magnification value.
             Note: Returns Nan when the instrument is in TEM diffraction mode.
         """
-        if self.get_mode() == "TEM":
-            if self.get_projection_mode() == "imaging":
+        # Every mode check is a call through the COM interface, so only check each mode once.
+        mode = self.get_mode()
+        if mode == "TEM":
+            projection_mode = self.get_projection_mode()
+            if projection_mode == "imaging":
                 return self._tem.Projection.Magnification
-            elif self.get_projection_mode() == "diffraction":
+            elif projection_mode == "diffraction":
                 warnings.warn("Since we are in TEM diffraction mode, get_magnification() is returning Nan...")
                 return math.nan
             else:
                 raise Exception("Projection mode (" + str(self._tem.Projection.Mode) + ") not recognized.")
 
-        elif self.get_mode() == "STEM":
+        elif mode == "STEM":
             # TODO: Figure out how to reliably obtain the magnification while in STEM mode.
             warnings.warn("get_magnification() is not working as expected while the instrument is in STEM mode.")
             return self._tem.Illumination.StemMagnification
@@ -60,11 +88,12 @@ class MagnificationMixin(ModeMixin):
             The new STEM magnification. Available magnifications in STEM mode (SA) range from 4,300 to 630,000.
         :return: None.
         """
-        if self.get_mode() == "TEM":
+        mode = self.get_mode()
+        if mode == "TEM":
             print("The microscope is currently in TEM mode. To adjust the magnification in TEM mode, please use "
                   "set_magnification_tem().. no changes made.")
 
-        elif self.get_mode() == "STEM":
+        elif mode == "STEM":
             # TODO: Figure out how to reliably set the magnification while in STEM mode.
             warnings.warn("set_stem_magnification() is not working as expected. STEM magnification may or may not have"
                           " been updated.")
@@ -86,11 +115,12 @@ class MagnificationMixin(ModeMixin):
         :return: None.
         """
         new_magnification_index = int(new_magnification_index)
-        if self.get_mode() == "STEM":
+        mode = self.get_mode()
+        if mode == "STEM":
             print("The microscope is currently in STEM mode. To adjust the magnification in STEM mode, please use "
                   "set_magnification_stem().. no changes made.")
 
-        elif self.get_mode() == "TEM":
+        elif mode == "TEM":
             if new_magnification_index > 44:  # Upper bound (Very zoomed in; 1.05 Mx Zoom)
                 warnings.warn(
                     "The requested TEM magnification index (" + str(new_magnification_index) + ") is greater than "
@@ -120,11 +150,12 @@ class MagnificationMixin(ModeMixin):
 
         :return: None.
         """
-        if self.get_mode() == "STEM":
+        mode = self.get_mode()
+        if mode == "STEM":
             print("The microscope is currently in STEM mode. To adjust the magnification in STEM mode, please use "
                   "set_magnification_stem().. no changes made.")
 
-        elif self.get_mode() == "TEM":
+        elif mode == "TEM":
             current_magnification_index = self.get_magnification_index()
             new_magnification_index = current_magnification_index + int(magnification_shift)
 
@@ -160,52 +191,34 @@ class MagnificationMixin(ModeMixin):
 
         :return: None.
         """
-        print("The microscope is currently in " + self.get_mode() + " " + self.get_projection_mode() + " mode. "
+        mode, projection_mode = self.get_mode(), self.get_projection_mode()
+        print("The microscope is currently in " + mode + " " + projection_mode + " mode. "
               "Available magnifications are as follows:")
 
-        if self.get_mode() == "TEM":
+        if mode == "TEM":
 
-            if self.get_projection_mode() == "imaging":
-                available_magnifications = [25.0, 34.0, 46.0, 62.0, 84.0, 115.0, 155.0, 210.0, 280.0, 380.0,
-                                            510.0, 700.0, 940.0, 1300.0, 1700.0, 2300.0, 2050.0, 2600.0, 3300.0,
-                                            4300.0, 5500.0, 7000.0, 8600.0, 11000.0, 14000.0, 17500.0, 22500.0,
-                                            28500.0, 36000.0, 46000.0, 58000.0, 74000.0, 94000.0, 120000.0,
-                                            150000.0, 190000.0, 245000.0, 310000.0, 390000.0, 500000.0, 630000.0,
-                                            650000.0, 820000.0, 1050000.0]
+            if projection_mode == "imaging":
+                print(_TEM_IMAGING_MAGNIFICATION_TABLE)
 
-                print("{:<20} {:<20}".format("Magnification Index", "Magnification [x Zoom]"))
-                for i, magnification in enumerate(available_magnifications):
-                    print("{:<20} {:<20}".format(i + 1, magnification))
-
-            elif self.get_projection_mode() == "diffraction":
+            elif projection_mode == "diffraction":
                 warnings.warn("Magnification not relevant in TEM diffraction mode.")  # TODO: Is this true?
 
             else:
                 warnings.warn("Projection mode not recognized.. no available magnifications found.")
 
-        elif self.get_mode() == "STEM":
-
-            if self.get_projection_mode() == "imaging":
-                available_magnifications = [4300.0, 5500.0, 7000.0, 8600.0, 11000.0, 14000.0, 17500.0, 22500.0,
-                                            28500.0, 36000.0, 46000.0, 58000.0, 74000.0, 94000.0, 120000.0,
-                                            150000.0, 190000.0, 245000.0, 310000.0, 390000.0, 500000.0, 630000.0]
-
-            elif self.get_projection_mode() == "diffraction":
-                available_magnifications = [320.0, 450.0, 630.0, 900.0, 1250.0, 1800.0, 2550.0, 3600.0, 5100.0, 7200.0,
-                                            10000.0, 14500.0, 20500.0, 28500.0, 41000.0, 57000.0, 81000.0, 115000.0,
-                                            160000.0, 230000.0, 320000.0, 460000.0, 650000.0, 920000.0, 1300000.0,
-                                            5000, 7000, 9900, 14000, 20000, 28000, 40000, 56000, 79000, 110000.0,
-                                            160000.0, 225000.0, 320000.0, 450000.0, 630000.0, 900000.0, 1250000.0,
-                                            1800000.0, 2550000.0, 3600000.0, 5100000.0, 7200000.0, 10000000.0,
-                                            14500000.0, 20500000.0, 28500000.0, 41000000.0, 57000000.0, 81000000.0,
-                                            115000000.0, 160000000.0, 230000000.0, 320000000.0]
+        elif mode == "STEM":
+
+            if projection_mode == "imaging":
+                available_magnifications = _STEM_IMAGING_MAGNIFICATIONS
+
+            elif projection_mode == "diffraction":
+                available_magnifications = _STEM_DIFFRACTION_MAGNIFICATIONS
             else:
                 warnings.warn("Projection mode not recognized.. no available magnifications found.")
-                available_magnifications = []
+                available_magnifications = ()
 
-            print("Magnification [x Zoom]")
-            for magnification in available_magnifications:
-                print(magnification)
+            # Print everything at once, every print() costs us a (slow) write to the console.
+            print("\n".join(["Magnification [x Zoom]"] + [str(mag) for mag in available_magnifications]))
 
         else:
             raise Exception("Error: Microscope mode unknown.")
@@ -5,6 +5,8 @@
 
 import comtypes.client as cc
 
+from typing import TYPE_CHECKING
+
 from pyTEM.lib.mixins.ScreenMixin import ScreenMixin
 
 
@@ -14,11 +16,9 @@ class ModeMixin(ScreenMixin):
 
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
+    if TYPE_CHECKING:
         # Unresolved attribute warning suppression
         _tem: type(cc.CreateObject("TEMScripting.Instrument"))
-    except OSError:
-        pass
 
     def get_mode(self) -> str:
         """
@@ -27,10 +27,11 @@ class ModeMixin(ScreenMixin):
             - "TEM" (normal imaging mode)
             - "STEM" (Scanning TEM)
         """
-        if self._tem.InstrumentModeControl.InstrumentMode == 0:
+        instrument_mode = self._tem.InstrumentModeControl.InstrumentMode  # Only go through the COM interface once.
+        if instrument_mode == 0:
             return "TEM"
 
-        elif self._tem.InstrumentModeControl.InstrumentMode == 1:
+        elif instrument_mode == 1:
             return "STEM"  # Scanning TEM
 
         else:
@@ -66,10 +67,11 @@ class ModeMixin(ScreenMixin):
         :return: str:
             The current projection mode, either "diffraction" or "imaging".
         """
-        if self._tem.Projection.Mode == 1:
+        projection_mode = self._tem.Projection.Mode  # Only go through the COM interface once.
+        if projection_mode == 1:
             return "imaging"
 
-        elif self._tem.Projection.Mode == 2:
+        elif projection_mode == 2:
             return "diffraction"
 
         else:
@@ -143,14 +145,15 @@ class ModeMixin(ScreenMixin):
             - "nanoprobe" (used to get a small convergent electron beam)
             - "microprobe" (provides a nearly parallel illumination at the cost of a larger probe size)
         """
-        if self._tem.Illumination.Mode == 0:
+        illumination_mode = self._tem.Illumination.Mode  # Only go through the COM interface once.
+        if illumination_mode == 0:
             return "nanoprobe"
 
-        elif self._tem.Illumination.Mode == 1:
+        elif illumination_mode == 1:
             return "microprobe"
 
         else:
-            raise Exception("Error: Projection mode '" + str(self._tem.Illumination.Mode) + "' not recognized.")
+            raise Exception("Error: Projection mode '" + str(illumination_mode) + "' not recognized.")
 
     def set_illumination_mode(self, new_mode: str) -> None:
         """
@@ -5,6 +5,8 @@
 
 import comtypes.client as cc
 
+from typing import TYPE_CHECKING
+
 
 class ScreenMixin:
     """
@@ -12,11 +14,9 @@ class ScreenMixin:
 
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
+    if TYPE_CHECKING:
         # Unresolved attribute warning suppression
         _tem: type(cc.CreateObject("TEMScripting.Instrument"))
-    except OSError:
-        pass
 
     def get_screen_position(self) -> str:
         """
@@ -24,14 +24,15 @@ class ScreenMixin:
             - 'retracted' (required to take images)
             - 'inserted' (required to use the FluCam to view the live image)
         """
-        if self._tem.Camera.MainScreen == 2:
+        main_screen = self._tem.Camera.MainScreen  # Only go through the COM interface once.
+        if main_screen == 2:
             return "retracted"
 
-        elif self._tem.Camera.MainScreen == 3:
+        elif main_screen == 3:
             return "inserted"
 
         else:
-            raise Exception("Error: Current screen position (" + str(self._tem.Camera.MainScreen) + ") not recognized.")
+            raise Exception("Error: Current screen position (" + str(main_screen) + ") not recognized.")
 
     def insert_screen(self) -> None:
         """
@@ -6,7 +6,7 @@
 import math
 import copy
 import warnings
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 import comtypes.client as cc
 
@@ -22,11 +22,9 @@ class StageMixin:
 
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
+    if TYPE_CHECKING:
         # Unresolved attribute warning suppression
         _tem: type(cc.CreateObject("TEMScripting.Instrument"))
-    except OSError:
-        pass
 
     def get_stage_position(self) -> StagePosition:
         """
@@ -517,7 +515,16 @@ class StageInterface(StageMixin):
     A microscope interface with only stage controls.
     """
 
-    def __init__(self):
+    def __init__(self, tem=None):
+        """
+        :param tem: Thermo Fisher Instrument object (optional; default is None):
+            An existing Thermo Fisher Instrument object to use (e.g. one marshalled in from another thread). If None,
+             we create our own.
+        """
+        if tem is not None:
+            self._tem = tem
+            return
+
         try:
             self._tem = cc.CreateObject("TEMScripting.Instrument")
         except OSError as e:
@@ -4,7 +4,7 @@
 """
 
 import math
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, Dict, List, Union
 
 import comtypes.client as cc
 
@@ -17,11 +17,9 @@ class VacuumMixin:
 
     This mixin was developed in support of pyTEM.Interface, but can be included in other projects where helpful.
     """
-    try:
+    if TYPE_CHECKING:
         # Unresolved attribute warning suppression
         _tem: type(cc.CreateObject("TEMScripting.Instrument"))
-    except OSError:
-        pass
 
     def _pull_vacuum_info(self) -> Dict[int, List[Union[str, float]]]:
         """
@@ -0,0 +1,27 @@
+"""
+ Author:  Michael Luciuk
+ Date:    Summer 2022
+"""
+
+import time
+
+# Taken once, so that all conversions agree with one another. time.time() is only good to about 15 ms on some Windows
+#  systems, so converted times may be off by that much in absolute terms, but the differences between them are as
+#  accurate as time.perf_counter() itself.
+_EPOCH_OFFSET = time.time() - time.perf_counter()
+
+
+def perf_counter_to_epoch(perf_counter_time: float) -> float:
+    """
+    Convert a time.perf_counter() value into seconds since the epoch (like time.time()).
+
+    We time with time.perf_counter() because it is monotonic and high-resolution (time.time() can jump around with
+     clock adjustments), but epoch times are easier to relate to the rest of the world (e.g. to acquisition metadata).
+
+    :param perf_counter_time: float:
+        A time.perf_counter() value.
+
+    :return: float:
+        The same time, in seconds since the epoch.
+    """
+    return perf_counter_time + _EPOCH_OFFSET
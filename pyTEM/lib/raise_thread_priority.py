@@ -0,0 +1,29 @@
+"""
+ Author:  Michael Luciuk
+ Date:    Summer 2022
+"""
+
+import ctypes
+
+# See the Windows SetThreadPriority() documentation.
+_THREAD_PRIORITY_TIME_CRITICAL = 15
+
+
+def raise_thread_priority() -> bool:
+    """
+    Raise the scheduling priority of the calling thread, so that it is less likely to be preempted (and so its waits
+     are less likely to overshoot). This is helpful for threads that need to issue microscope commands at precise times,
+     such as the blanker and tilt threads.
+
+    Notice that Windows threads inherit the priority class of their process, and this only raises the priority of the
+     calling thread within that class. The thread should spend most of its time blocked (waiting on a queue or
+     sleeping), otherwise it will starve the other threads in the process.
+
+    :return: bool:
+        True if the priority was raised, False otherwise (e.g. we are not on Windows).
+    """
+    try:
+        kernel32 = ctypes.windll.kernel32
+        return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_PRIORITY_TIME_CRITICAL))
+    except (AttributeError, OSError):
+        return False  # ctypes.windll is only available on Windows.
@@ -5,12 +5,17 @@
 
 import math
 import time
+import comtypes
 
-from typing import Union
+from typing import Any, Dict, Union
 from numpy.typing import ArrayLike
 
+from pyTEM.lib.com_marshalling import unmarshal_com_object
+from pyTEM.lib.perf_counter_to_epoch import perf_counter_to_epoch
+from pyTEM.lib.raise_thread_priority import raise_thread_priority
 from pyTEM.lib.mixins.StageMixin import StageInterface
 from pyTEM.lib.tem_tilt_speed import tem_tilt_speed
+from pyTEM.lib.wait_until import wait_until
 
 
 def tilt_control(num_acquisitions: int, barriers: ArrayLike, integration_time: float,
@@ -76,19 +81,98 @@ def tilt_control(num_acquisitions: int, barriers: ArrayLike, integration_time: f
         tilt_speed = tem_tilt_speed(tilt_speed)  # convert to fractional speed as required by the stage setters.
 
         barriers[i].wait()  # Synchronize with the main process.
+        barrier_release_time = time.perf_counter()
 
         # Wait while the camera is blind. Notice we wait a little longer than the integration time, this is because
         #  the acquisition command takes a little longer to issue than the tilt command.
-        time.sleep(0.03 + integration_time)
+        wait_until(deadline=barrier_release_time + 0.03 + integration_time)
 
         # Perform tilt. This blocks the program for the full integration time so no need to sleep.
-        tilt_start_time = time.time()
+        tilt_start_time = time.perf_counter()
         interface.set_stage_position_alpha(alpha=tilt_bounds[i + 1], speed=tilt_speed, movement_type="go")
-        tilt_stop_time = time.time()
+        tilt_stop_time = time.perf_counter()
 
         if verbose:
-            print("-- Timing results from tilt_control() for acquisition #" + str(i) + " --")
+            # Print everything at once, every print() costs us a (slow) write to the console.
+            print("-- Timing results from tilt_control() for acquisition #" + str(i) + " --\n"
+                  + "\nStarted titling at: " + str(perf_counter_to_epoch(tilt_start_time))
+                  + "\nStopped tilting at: " + str(perf_counter_to_epoch(tilt_stop_time))
+                  + "\nTotal time spent tilting: " + str(tilt_stop_time - tilt_start_time))
 
-            print("\nStarted titling at: " + str(tilt_start_time))
-            print("Stopped tilting at: " + str(tilt_stop_time))
-            print("Total time spent tilting: " + str(tilt_stop_time - tilt_start_time))
+
+def tilt_worker(jobs, done, ready, settings: Dict[str, Any], marshalled_tem=None) -> None:
+    """
+    Support pyTEM.Interface.acquisition() with simultaneous tilt control from a persistent parallel thread.
+
+    Unlike tilt_control(), which is spawned anew for every acquisition series, this function is meant to be started
+     once (in a parallel thread) and then reused for all subsequent acquisitions. This saves us the cost of creating a
+     new process, and a new microscope interface, for every acquisition series. Even better, if we are given the main
+     thread's Thermo Fisher Instrument object (marshalled into this thread) then we don't need to create our own at all.
+
+    Notice this worker doesn't move the stage to the starting angle, that is up to whoever is sending us jobs.
+
+    :param jobs: queue.Queue:
+        The queue from which we receive jobs. Each job is a (start_time, alpha, speed) tuple, where start_time is the
+         time.perf_counter() value at which the main thread is about to issue the acquisition command, alpha is the
+         angle to which to tilt (in degrees), and speed is the fractional tilt speed (see tem_tilt_speed()). Jobs should
+         be put on the queue right before the acquisition command is issued. Put None on the queue to stop the worker.
+    :param done: threading.Event:
+        Set once we have finished with a job (we are done tilting).
+    :param ready: threading.Event:
+        Set once we have built our interface and are ready to receive jobs.
+    :param settings: dict:
+        A dictionary shared with the main thread, with the keys 'integration_time' (the exposure time, in seconds) and
+         'verbose' (whether to print out extra information). These are read at the start of every job, so they only
+         need to be updated when they change (i.e. once per acquisition series) and only while no job is in progress.
+    :param marshalled_tem: (optional; default is None):
+        A Thermo Fisher Instrument object, as marshalled with pyTEM.lib.com_marshalling.marshal_com_object(). If None,
+         we create our own Instrument object.
+
+    :return: None.
+    """
+    # COM needs to be initialized in every thread that uses it (comtypes only does so automatically for the main one).
+    comtypes.CoInitialize()
+    try:
+        # Our commands need to go out on time, so we don't want to be preempted.
+        raise_thread_priority()
+
+        # Build an interface with stage controls that this thread can use to control the microscope.
+        if marshalled_tem is not None:
+            interface = StageInterface(tem=unmarshal_com_object(marshalled_tem))
+        else:
+            interface = StageInterface()
+        ready.set()
+
+        i = 0
+        while True:
+            job = jobs.get()
+            if job is None:
+                break  # We are done.
+
+            start_time, alpha, speed = job
+            verbose = settings['verbose']
+
+            # Wait while the camera is blind. Notice we wait a little longer than the integration time, this is
+            #  because the acquisition command takes a little longer to issue than the tilt command.
+            wait_until(deadline=start_time + 0.03 + settings['integration_time'])
+
+            # Perform tilt. This blocks for the full integration time.
+            tilt_start_time = time.perf_counter()
+            interface.set_stage_position_alpha(alpha=alpha, speed=speed, movement_type="go")
+            tilt_stop_time = time.perf_counter()
+
+            # Let the main thread know we are done before we print, writing to the console is slow.
+            done.set()
+
+            if verbose:
+                # Print everything at once, every print() costs us a (slow) write to the console.
+                print("-- Timing results from tilt_worker() for acquisition #" + str(i) + " --\n"
+                      + "\nStarted titling at: " + str(perf_counter_to_epoch(tilt_start_time))
+                      + "\nStopped tilting at: " + str(perf_counter_to_epoch(tilt_stop_time))
+                      + "\nTotal time spent tilting: " + str(tilt_stop_time - tilt_start_time))
+
+            i += 1
+
+        del interface  # Release the COM object before we uninitialize.
+    finally:
+        comtypes.CoUninitialize()
@@ -0,0 +1,29 @@
+"""
+ Author:  Michael Luciuk
+ Date:    Summer 2022
+"""
+
+import time
+
+
+def wait_until(deadline: float, spin: float = 0.002) -> None:
+    """
+    Wait until the provided time.perf_counter() deadline. We sleep for most of the wait, but busy-wait for the last
+     little bit because time.sleep() can overshoot by a few milliseconds.
+
+    Scheduling against absolute deadlines (rather than chaining sleeps) also means that any overshoot doesn't
+     accumulate over a sequence of waits.
+
+    :param deadline: float:
+        The time.perf_counter() value at which to return. If the deadline has already passed, we return right away.
+    :param spin: float (optional; default is 0.002):
+        How long before the deadline to stop sleeping and start busy-waiting, in seconds.
+
+    :return: None.
+    """
+    remaining = deadline - time.perf_counter() - spin
+    if remaining > 0:
+        time.sleep(remaining)
+
+    while time.perf_counter() < deadline:
+        pass
@@ -13,6 +13,7 @@ from numpy.typing import ArrayLike
 
 from pyTEM.lib.mixins.BeamBlankerMixin import BeamBlankerMixin
 from pyTEM.lib.mixins.StageMixin import StageMixin
+from pyTEM.lib.perf_counter_to_epoch import perf_counter_to_epoch
 from pyTEM.lib.tem_tilt_speed import tem_tilt_speed
 
 
@@ -101,13 +102,13 @@ def blanker_tilt_control(num_acquisitions: int,
         if blanker_optimization:
             # Unblank while the acquisition is active.
             interface.unblank_beam()
-            beam_unblank_time = time.time()
+            beam_unblank_time = time.perf_counter()
 
         if tilting:
             # Perform a tilt, this blocks the program for the full integration time so no need to sleep.
-            tilt_start_time = time.time()
+            tilt_start_time = time.perf_counter()
             interface.set_stage_position_alpha(alpha=tilt_bounds[i + 1], speed=tilt_speed, movement_type="go")
-            tilt_stop_time = time.time()
+            tilt_stop_time = time.perf_counter()
         else:
             # Otherwise, we have to wait while the camera is recording.
             time.sleep(exposure_time)
@@ -115,17 +116,17 @@ def blanker_tilt_control(num_acquisitions: int,
         if blanker_optimization:
             # Re-blank the beam.
             interface.blank_beam()
-            beam_reblank_time = time.time()
+            beam_reblank_time = time.perf_counter()
 
         if verbose:
             print("-- Timing results from blanker_tilt_control() for acquisition #" + str(i) + " --")
             if blanker_optimization:
-                print("\nUnblanked the beam at: " + str(beam_unblank_time))
-                print("Re-blanked the beam at: " + str(beam_reblank_time))
+                print("\nUnblanked the beam at: " + str(perf_counter_to_epoch(beam_unblank_time)))
+                print("Re-blanked the beam at: " + str(perf_counter_to_epoch(beam_reblank_time)))
                 print("Total time spent with the beam unblanked: " + str(beam_reblank_time - beam_unblank_time))
             if tilting:
-                print("\nStarted titling at: " + str(tilt_start_time))
-                print("Stopped tilting at: " + str(tilt_stop_time))
+                print("\nStarted titling at: " + str(perf_counter_to_epoch(tilt_start_time)))
+                print("Stopped tilting at: " + str(perf_counter_to_epoch(tilt_stop_time)))
                 print("Total time spent tilting: " + str(tilt_stop_time - tilt_start_time))
 
 
@@ -9,7 +9,7 @@ from matplotlib import pyplot as plt
 from pyTEM.lib.Acquisition import Acquisition
 
 
-out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve() \
+out_dir = pathlib.Path(__file__).resolve().parents[1] \
                 / "interface" / "test_images"
 out_file = out_dir / "cat.jpeg"
 
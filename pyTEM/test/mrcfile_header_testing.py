@@ -11,7 +11,7 @@ import numpy as np
 import mrcfile
 # np.set_printoptions(threshold=np.inf)
 
-out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve().parent.resolve() / "test" \
+out_dir = pathlib.Path(__file__).resolve().parents[2] / "test" \
                 / "interface" / "test_images"
 in_file_ = out_dir / "size_testing.mrc"
 # in_file_ = out_dir / "Valid_tilt_series.mrc"
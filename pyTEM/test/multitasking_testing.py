@@ -12,6 +12,7 @@ from pathos.helpers import mp
 from pyTEM.Interface import Interface
 from pyTEM.lib.AcquisitionSeries import AcquisitionSeries
 from pyTEM.lib.mixins.BeamBlankerMixin import BeamBlankerInterface
+from pyTEM.lib.perf_counter_to_epoch import perf_counter_to_epoch
 from pyTEM_scripts.test.micro_ed.AcquisitionSeriesProperties import AcquisitionSeriesProperties
 
 # https://stackoverflow.com/questions/3246525/why-cant-i-create-a-com-object-in-a-new-thread-in-python
@@ -102,12 +103,12 @@ class TiltingThread(threading.Thread):
         """
         We are able to access the stage controls (including tilting) just fine.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.microscope.set_stage_position_alpha(alpha=self.destination, speed=self.speed, movement_type="go")
-        stop_time = time.time()
+        stop_time = time.perf_counter()
 
-        print("\nStarting tilting at: " + str(start_time))
-        print("Stopping tilting at: " + str(stop_time))
+        print("\nStarting tilting at: " + str(perf_counter_to_epoch(start_time)))
+        print("Stopping tilting at: " + str(perf_counter_to_epoch(stop_time)))
         print("Total time spent tilting: " + str(stop_time - start_time))
 
 
@@ -141,13 +142,13 @@ class TiltingProcess(mp.Process):
         # print(tem.Projection.Mode)
         # print(self.microscope._tem.Illumination.BeamBlanked)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.microscope.set_stage_position_alpha(alpha=self.destination, speed=self.speed, movement_type="go")
-        stop_time = time.time()
+        stop_time = time.perf_counter()
 
         if self.verbose:
-            print("\nStarting tilting at: " + str(start_time))
-            print("Stopping tilting at: " + str(stop_time))
+            print("\nStarting tilting at: " + str(perf_counter_to_epoch(start_time)))
+            print("Stopping tilting at: " + str(perf_counter_to_epoch(stop_time)))
             print("Total time spent tilting: " + str(stop_time - start_time))
 
 
@@ -167,14 +168,14 @@ def blanker(exposure_time):
     time.sleep(exposure_time)
 
     # Unblank for one exposure_time while the acquisition is active.
-    beam_unblank_time = time.time()
+    beam_unblank_time = time.perf_counter()
     beam_blanker_interface.unblank_beam()
     time.sleep(exposure_time)
-    beam_reblank_time = time.time()
+    beam_reblank_time = time.perf_counter()
     beam_blanker_interface.blank_beam()
 
-    print("\nUnblanked the beam at: " + str(beam_unblank_time))
-    print("Re-blanked the beam at: " + str(beam_reblank_time))
+    print("\nUnblanked the beam at: " + str(perf_counter_to_epoch(beam_unblank_time)))
+    print("Re-blanked the beam at: " + str(perf_counter_to_epoch(beam_reblank_time)))
     print("Total time spent with the beam unblanked: " + str(beam_reblank_time - beam_unblank_time))
 
 
@@ -6,7 +6,7 @@ import hyperspy.api as hs
 from tifffile import tifffile
 
 
-out_dir = pathlib.Path(__file__).parent.resolve().parent.resolve().parent.resolve() / "test" \
+out_dir = pathlib.Path(__file__).resolve().parents[2] / "test" \
                 / "interface" / "test_images"
 print(out_dir)
 in_file_ = out_dir / "example_tiff_stack.tif"
@@ -17,6 +17,7 @@ from typing import Union, Tuple
 from pathlib import Path
 
 from pyTEM.Interface import Interface
+from pyTEM.lib.mixins.AcquisitionMixin import CameraSelectionError
 
 from pyTEM_scripts.lib.micro_ed.add_basf_icon_to_tkinter_window import add_basf_icon_to_tkinter_window
 from pyTEM_scripts.lib.micro_ed.exit_script import exit_script
@@ -591,11 +592,11 @@ def get_acquisition_parameters(microscope: Union[Interface, None]) -> Tuple[str,
         try:
             min_supported_exposure_time, max_supported_exposure_time = \
                 microscope.get_exposure_time_range(str(camera_name.get()))
-        except AttributeError:
+        except (AttributeError, CameraSelectionError):
             warnings.warn("Unable to obtain supported exposure time range, assuming 0.1 s to 100 s.")
             min_supported_exposure_time, max_supported_exposure_time = 0.1, 100
 
-        if min_supported_exposure_time < float(integration_time.get()) < max_supported_exposure_time:
+        if min_supported_exposure_time <= float(integration_time.get()) <= max_supported_exposure_time:
             break  # Input is okay  # TODO: Add tkinter validation to Entry widgets themselves
         else:
             warnings.warn("Invalid integration time. Integration time must be between "
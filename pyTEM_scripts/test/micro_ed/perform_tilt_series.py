@@ -10,6 +10,7 @@ from threading import Thread
 
 from pyTEM.Interface import Interface
 from pyTEM.lib.AcquisitionSeries import AcquisitionSeries
+from pyTEM.lib.perf_counter_to_epoch import perf_counter_to_epoch
 from pyTEM_scripts.test.micro_ed.AcquisitionSeriesProperties import AcquisitionSeriesProperties
 
 
@@ -58,11 +59,11 @@ def perform_tilt_series(microscope: Interface, acquisition_properties: Acquisiti
         tilting_thread.start()  # Start tilting
 
         # The acquisition must be performed here in the main thread where the COM interface was marshalled.
-        overall_acq_start_time = time.time()
+        overall_acq_start_time = time.perf_counter()
         acq, (core_acq_start, core_acq_end) = microscope.acquisition(
             camera_name=acquisition_properties.camera_name, sampling=acquisition_properties.sampling,
             exposure_time=acquisition_properties.integration_time)
-        overall_acq_end_time = time.time()
+        overall_acq_end_time = time.perf_counter()
 
         # Okay, wait for the tilting thread to return, and then we are done this one.
         tilting_thread.join()
@@ -72,8 +73,9 @@ def perform_tilt_series(microscope: Interface, acquisition_properties: Acquisiti
             print("Core acquisition returned at: " + str(core_acq_end))
             print("Core acquisition time: " + str(core_acq_end - core_acq_start))
 
-            print("\nOverall acquisition() method call started at: " + str(overall_acq_start_time))
-            print("Overall acquisition() method returned at: " + str(overall_acq_end_time))
+            print("\nOverall acquisition() method call started at: "
+                  + str(perf_counter_to_epoch(overall_acq_start_time)))
+            print("Overall acquisition() method returned at: " + str(perf_counter_to_epoch(overall_acq_end_time)))
             print("Total overall time spent in acquisition(): " + str(overall_acq_end_time - overall_acq_start_time))
 
         acq_stack.append(acq)
@@ -114,13 +116,13 @@ class TiltingThread(Thread):
         # We need to give the acquisition thread a bit of a head start before we start tilting
         time.sleep(0.355 + self.integration_time)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.microscope.set_stage_position_alpha(alpha=self.destination, speed=self.speed, movement_type="go")
-        stop_time = time.time()
+        stop_time = time.perf_counter()
 
         if self.verbose:
-            print("\nStarting tilting at: " + str(start_time))
-            print("Stopping tilting at: " + str(stop_time))
+            print("\nStarting tilting at: " + str(perf_counter_to_epoch(start_time)))
+            print("Stopping tilting at: " + str(perf_counter_to_epoch(stop_time)))
             print("Total time spent tilting: " + str(stop_time - start_time))
 
 